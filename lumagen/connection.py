@@ -11,6 +11,7 @@ from collections import deque
 from collections.abc import Awaitable, Callable
 import contextlib
 from dataclasses import dataclass
+import logging
 from typing import Any
 
 import serial_asyncio_fast as serial_asyncio
@@ -35,6 +36,36 @@ from .utils import (
 INITIAL_READ_SIZE = 4
 DEFAULT_READ_BYTES = 8
 READ_TIMEOUT = 4
+# Seconds to wait for a newline before taking unterminated data (keypress echoes).
+READ_IDLE_TIMEOUT = 0.2
+READ_CHUNK_SIZE = 4096
+# Wire framing for an outgoing command, filled in with one %-format per send.
+COMMAND_FRAME = CMD_START + b"%b" + CMD_TERMINATOR
+# Distinct ASCII_COMMAND_LIST key lengths, longest first, so "<CR>" wins over "<".
+COMMAND_KEY_LENGTHS = tuple(
+    sorted({len(key) for key in ASCII_COMMAND_LIST}, reverse=True)
+)
+
+
+def _build_keypress_echoes() -> frozenset[bytes]:
+    """Return the complete keypress echoes: "#X{", and "#X" when unambiguous.
+
+    A bare "#X" is left out when it is also the start of a longer key's echo,
+    such as "#<" for "#<CR>".
+    """
+    framed = {CMD_START + key.encode("utf-8") for key in ASCII_COMMAND_LIST}
+    bare = {
+        echo
+        for echo in framed
+        if not any(other != echo and other.startswith(echo) for other in framed)
+    }
+    return frozenset({echo + CMD_TERMINATOR for echo in framed} | bare)
+
+
+# Unterminated data taken without waiting for a newline; see `_read_message`.
+KEYPRESS_ECHOES = _build_keypress_echoes()
+# Message starts located by adjust_buffer, highest priority first.
+MESSAGE_START_KEYWORDS = ("power", "#ZQS1", "!", "#")
 
 EventCallbackType = (
     Callable[[str, str | None], None] | Callable[[str, str | None], Awaitable[None]]
@@ -61,7 +92,7 @@ class ConnectionState(LoggingMixin):
         """Initialize a new ConnectionState instance.
 
         Attributes:
-            buffer (deque[str]): Stores incoming data.
+            buffer (bytearray): Stores incoming data.
             command_queue (deque): Holds commands to be sent.
             command_response_map (dict[str, str]): Maps commands to their expected responses.
             last_command_byte (str): Stores the last byte of the last command sent.
@@ -70,21 +101,22 @@ class ConnectionState(LoggingMixin):
 
         """
         super().__init__()
-        self.buffer: deque[str] = deque()
+        self.buffer = bytearray()
         self.command_queue = deque()
         self.command_response_map: dict[str, str] = {}
         self.last_command_byte: str = ""
         self.sending_command: bool = False
         self.current_command: str | None = None
 
-    def append_to_buffer(self, data: str) -> None:
+    def append_to_buffer(self, data: str | bytes) -> None:
         """Append data to the buffer.
 
         Args:
-            data (str): The data to append to the buffer.
+            data (str | bytes): The data to append to the buffer. Strings are
+                                stored UTF-8 encoded.
 
         """
-        self.buffer.extend(data)
+        self.buffer += data.encode("utf-8") if isinstance(data, str) else data
 
     def clear_buffer(self) -> None:
         """Clear the communication buffer."""
@@ -105,7 +137,10 @@ class ConnectionState(LoggingMixin):
         """Retrieve the next command from the queue and update the current command."""
         if self.command_queue:
             self.current_command = self.command_queue.popleft()
-            self.log.debug("Commands remaining in queue: %d", len(self.command_queue))
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug(
+                    "Commands remaining in queue: %d", len(self.command_queue)
+                )
             return self.current_command
         self.log.debug("Queue is empty after pop attempt")
         self.current_command = None
@@ -121,9 +156,11 @@ class BaseHandler(LoggingMixin):
         self._dispatcher: Dispatcher = dispatcher
         self._task_manager = TaskManager()
         self.connection_state = ConnectionState()
-        self._state_lock = asyncio.Lock()
+        self._command_ready = asyncio.Event()
         self.reader: asyncio.StreamReader = None
         self.writer: asyncio.StreamWriter = None
+        # Bytes read past the last newline, kept for the next `_read_message`.
+        self._unread = b""
 
     async def process_stream(self):
         """Process incoming data stream."""
@@ -151,10 +188,11 @@ class BaseHandler(LoggingMixin):
                 buffer_manager.clear()
                 return False
 
-            self.log.debug("Buffer updated: %s", buffer_manager.buffer.encode())
+            if self.log.isEnabledFor(logging.DEBUG):
+                self.log.debug("Buffer updated: %s", buffer_manager.buffer.encode())
 
             # Filter and adjust the buffer
-            buffer_manager.adjust_buffer(["power", "#ZQS1", "!", "#"])
+            buffer_manager.adjust_buffer(MESSAGE_START_KEYWORDS)
 
             if buffer_manager.starts_with(buffer_manager.ignored_prefixes):
                 buffer_manager.clear()
@@ -173,7 +211,7 @@ class BaseHandler(LoggingMixin):
                 return False
 
             key, value, is_keypress = process_command_or_keypress(
-                buffer_manager.buffer, ASCII_COMMAND_LIST
+                buffer_manager.buffer, ASCII_COMMAND_LIST, COMMAND_KEY_LENGTHS
             )
             if key:
                 log_message = (
@@ -190,12 +228,11 @@ class BaseHandler(LoggingMixin):
         while True:
             await asyncio.sleep(0)  # allow cancel task
             try:
-                if not await self._read_single_byte(buffer_manager):
+                data = await self._read_message()
+                if not data:
                     continue
 
-                data = await self._read_additional_data()
-                if data:
-                    buffer_manager.append(data)
+                buffer_manager.append(data)
 
                 if not await process_buffer():
                     continue
@@ -204,29 +241,44 @@ class BaseHandler(LoggingMixin):
                 self.log.debug("Task process_message cancelled.")
                 raise
 
-    async def _read_single_byte(self, buffer_manager: BufferManager):
-        """Read a single byte and append it to the buffer."""
-        single_byte = await self.reader.read(1)
-        if not single_byte:
-            self.log.warning("Stream ended unexpectedly")
-            await asyncio.sleep(0.1)
-            return False
+    async def _read_message(self) -> bytes:
+        """Read the next message from the stream.
+
+        Accumulates data until a newline-terminated message is complete. Data
+        still unterminated after `READ_IDLE_TIMEOUT` seconds is only returned
+        early when it is a whole keypress echo such as "#X{"; any other fragment
+        keeps waiting for its terminator, so a message delivered in pieces is
+        never split. Bytes read past the last newline are kept for the next call.
 
-        buffer_manager.append(single_byte.decode("utf-8"))
-        return True
+        Returns:
+            bytes: The data read, or b"" if the stream has ended.
 
-    async def _read_additional_data(self) -> str:
-        """Read additional data from the stream with timeout."""
-        for read_func in [
-            lambda: self.reader.readuntil(separator=b"\n"),
-            lambda: self.reader.read(1024),
-        ]:
+        """
+        data, self._unread = self._unread, b""
+        while data.strip() not in KEYPRESS_ECHOES:
             try:
-                data: bytes = await asyncio.wait_for(read_func(), timeout=0.2)
-                return data.decode("utf-8") if data else ""
+                data += await asyncio.wait_for(
+                    self.reader.readuntil(separator=b"\n"), timeout=READ_IDLE_TIMEOUT
+                )
             except asyncio.exceptions.TimeoutError:
-                continue
-        return ""
+                chunk = await self.reader.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                data += chunk
+                end = data.rfind(b"\n") + 1
+                if not end:
+                    continue
+                data, self._unread = data[:end], data[end:]
+            except asyncio.LimitOverrunError:
+                data += await self.reader.read(READ_CHUNK_SIZE)
+            except asyncio.IncompleteReadError as ex:
+                data += ex.partial
+            break
+
+        if not data:
+            self.log.warning("Stream ended unexpectedly")
+            await asyncio.sleep(0.1)
+        return data
 
     async def send(self, data: bytes):
         """Abstract method for sending data over the connection."""
@@ -261,52 +313,34 @@ class BaseHandler(LoggingMixin):
         self.process_next_command()
 
     def process_next_command(self):
-        """Trigger processing of the next command in the queue."""
-        if not self._task_manager.get_task("process_next_command"):
-            self._task_manager.add_task(
-                self._process_next_command(),
-                "process_next_command",
-            )
+        """Wake the command consumer to send the next queued command."""
+        self._command_ready.set()
 
-    async def _process_next_command(self, max_iterations: int | None = None):
-        """Process the next command in the queue if no command is currently being sent.
-
-        Args:
-            max_iterations (int | None): Maximum iterations for processing commands,
-                                        primarily for testing or debugging. If None,
-                                        processes until conditions are met.
+    async def _send_commands(self):
+        """Send queued commands for the life of the connection.
 
+        Started alongside `process_stream` when the connection is established.
+        Each wake-up sends at most one command, so commands stay paced by the
+        device's replies: `process_stream` wakes the consumer after every message.
         """
-        iteration_count = 0
-
+        state = self.connection_state
         while True:
-            if max_iterations and iteration_count >= max_iterations:
-                break
-            iteration_count += 1
-
-            async with self._state_lock:
-                if self._should_exit_processing():
-                    self.log.debug("No more commands in the queue. Exiting loop")
-                    break
+            await self._command_ready.wait()
+            self._command_ready.clear()
 
-                command: str = self.connection_state.pop_next_command()
-                if not command:
-                    continue
-
-                data: bytes = CMD_START + command.encode("utf-8") + CMD_TERMINATOR
-
-            if not await self.send(data):
-                break
-
-    def _should_exit_processing(self) -> bool:
-        """Check conditions to exit the processing loop."""
-        if self.connection_state.sending_command:
-            return True
+            if state.sending_command or not state.has_pending_commands():
+                continue
 
-        if not self.connection_state.has_pending_commands():
-            return True
+            command: str = state.pop_next_command()
+            if not command:
+                continue
 
-        return False
+            try:
+                await self.send(COMMAND_FRAME % command.encode("utf-8"))
+            except Exception as ex:  # noqa: BLE001
+                # Keep the consumer alive so later commands are still sent.
+                self.log.error("Failed to send command %s: %s", command, ex)
+                state.sending_command = False
 
     async def close(self):
         """Clean up tasks and close the connection."""
@@ -329,7 +363,6 @@ class SerialHandler(BaseHandler, asyncio.Protocol):
 
         self.transport: asyncio.Transport | None = None
         self.config = SerialConfig()
-        self._state_lock = asyncio.Lock()
 
     def connection_made(self, transport: serial_asyncio.SerialTransport) -> None:
         """Made Connection."""
@@ -350,6 +383,7 @@ class SerialHandler(BaseHandler, asyncio.Protocol):
         )
 
         self._task_manager.add_task(self.process_stream(), "process_stream")
+        self._task_manager.add_task(self._send_commands(), "send_commands")
 
     async def connection_lost(self, exc) -> None:
         """Lost Connection."""
@@ -422,7 +456,7 @@ class SerialHandler(BaseHandler, asyncio.Protocol):
             transport_details = cls.extract_serial_transport_details(transport)
 
             temp_instance.log.debug("Transport Details:")
-            custom_log_pprint(transport_details, temp_instance.log.debug)
+            custom_log_pprint(transport_details, temp_instance.log)
 
             return protocol
 
@@ -446,6 +480,7 @@ class IPHandler(BaseHandler):
     async def open_connection(self, host: str, port: int) -> IPHandler:
         """Open an asynchronous ip connection."""
         self.reader, self.writer = await asyncio.open_connection(host, port)
+        self._unread = b""
         self.log.info("IP connection established to %s:%d", host, port)
 
         self._task_manager.add_task(
@@ -458,6 +493,7 @@ class IPHandler(BaseHandler):
         )
 
         self._task_manager.add_task(self.process_stream(), "process_stream")
+        self._task_manager.add_task(self._send_commands(), "send_commands")
 
     async def send(self, data: bytes) -> None:
         """Send data over the IP connection."""
@@ -27,6 +27,7 @@ import contextlib
 from datetime import UTC, datetime
 import errno
 from functools import partial
+import logging
 import os
 from typing import Any
 
@@ -488,10 +489,14 @@ class DeviceManager(LoggingMixin):
                     self.context.connection.config.status
                     == ConnectionStatus.DISCONNECTED
                 ):
+                    system_state = self.context.system_state
+                    system_state.update_state(
+                        operational_state=system_state.operational_state.model_copy(
+                            update={"is_alive": False}
+                        )
+                    )
                     self.context.device_state.info = None
                     self.context.connection.handler = None
-                    # self.context.device_state.is_alive = False
-                    self.context.system_state.operational_state.is_alive = False
                     self.log.warning("Connection lost. is_connected set to False.")
 
                     if self.context.connection.config.reconnect_enabled:
@@ -531,7 +536,7 @@ class DeviceManager(LoggingMixin):
         self.context.device_state.info = updated_device_info
         self.log.info("Device Info updated successfully.")
 
-        custom_log_pprint(self.device_info.model_dump(), self.log.debug)
+        custom_log_pprint(self.device_info.model_dump(), self.log)
 
     async def _handle_data_received(self, response: Any) -> None:
         """Handle responses received from the hardware."""
@@ -652,7 +657,7 @@ class DeviceManager(LoggingMixin):
             )
             custom_log_pprint(
                 self.context.system_state.operational_state.model_dump(),
-                self.log.debug,
+                self.log,
             )
         else:
             self.log.debug("Operational State unchanged, no update needed.")
@@ -665,7 +670,7 @@ class DeviceManager(LoggingMixin):
 
         if updated:
             self.log.debug("%s Updated", state_attr.replace("_", " ").title())
-            custom_log_pprint(state_value.model_dump(), self.log.debug)
+            custom_log_pprint(state_value.model_dump(), self.log)
         else:
             self.log.debug(
                 "%s unchanged, no update needed.", state_attr.replace("_", " ").title()
@@ -689,7 +694,7 @@ class DeviceManager(LoggingMixin):
             self.log.info("Full Info %s Updated", version)
             custom_log_pprint(
                 self.context.system_state.full_info.model_dump(),
-                self.log.debug,
+                self.log,
             )
 
             if self.context.device_state.device_event.is_set():
@@ -733,7 +738,7 @@ class DeviceManager(LoggingMixin):
     async def show_all(self) -> None:
         """Show all system state info."""
 
-        custom_log_pprint(self.context.system_state.to_dict(), self.log.info)
+        custom_log_pprint(self.context.system_state.to_dict(), self.log, logging.INFO)
 
     async def show_info(self) -> None:
         """Log all device information."""
@@ -743,7 +748,7 @@ class DeviceManager(LoggingMixin):
             return
 
         self.log.info("Displaying device information:")
-        custom_log_pprint(self.device_info.model_dump(), self.log.info)
+        custom_log_pprint(self.device_info.model_dump(), self.log, logging.INFO)
 
     async def show_labels(self) -> None:
         """Show device port labels, sorted and categorized into lists."""
@@ -762,7 +767,7 @@ class DeviceManager(LoggingMixin):
         }
 
         self.log.info("Displaying sorted port labels:")
-        custom_log_pprint(sorted_labels, self.log.info)
+        custom_log_pprint(sorted_labels, self.log, logging.INFO)
 
         # Categorize labels based on key prefixes
         self.source_list = [v for k, v in sorted_labels.items() if k.startswith("A")]
@@ -781,7 +786,7 @@ class DeviceManager(LoggingMixin):
             return
 
         self.log.debug("Displaying source list:")
-        custom_log_pprint(self.source_list, self.log.debug)
+        custom_log_pprint(self.source_list, self.log)
 
     async def show_power_state(self) -> None:
         """Show Device Power State."""
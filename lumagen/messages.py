@@ -96,9 +96,10 @@ class Response:
     def factory(cls, message: str) -> Response:
         """Create a new response object based on the message type."""
         parsed = MessageParser(message)
-        if parsed.name in registry:
-            return registry[parsed.name](parsed)
-        return cls(parsed)
+        response_cls = registry.get(parsed.name)
+        if response_cls is None:
+            return cls(parsed)
+        return response_cls(parsed)
 
     @property
     def fields(self) -> list:
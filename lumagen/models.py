@@ -17,9 +17,21 @@ Dependencies:
 - Provides enums for standardized status representation.
 """
 
-from typing import Annotated, ClassVar, Literal
-
-from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_validator
+import copy
+from dataclasses import replace
+from typing import Annotated, Any, ClassVar, Literal
+
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    Field,
+    TypeAdapter,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
+from pydantic.dataclasses import dataclass
+from pydantic.fields import FieldInfo
 
 from .constants import (
     DeviceStatus,
@@ -29,6 +41,38 @@ from .constants import (
     StateStatus,
 )
 
+_INTERLACED_MAP = {"1": "Interlaced", "0": "Progressive"}
+_NLS_ACTIVE_MAP = {"-": "Normal", "N": "NLS"}
+_DYNAMIC_RANGE_MAP = {"0": "SDR", "1": "HDR"}
+_SOURCE_MODE_MAP = {"i": "Interlaced", "p": "Progressive", "n": "No Source"}
+_OUTPUT_MODE_MAP = {"I": "Interlaced", "P": "Progressive"}
+_VR_SPECIAL = {"059": 59.94}
+
+
+def _map_interlaced(value: str | None) -> str | None:
+    """Map a raw interlaced flag to its label, passing unknown values through."""
+    return _INTERLACED_MAP.get(value, value)
+
+
+def _map_nls_active(value: str | None) -> str | None:
+    """Map a raw NLS flag to its label, or None if unknown."""
+    return _NLS_ACTIVE_MAP.get(value)
+
+
+def _map_source_dynamic_range(value: str | None) -> str | None:
+    """Map a raw dynamic range code to its label, or None if unknown."""
+    return _DYNAMIC_RANGE_MAP.get(value)
+
+
+def _map_source_mode(value: str | None) -> str | None:
+    """Map a raw source mode code to its label, or None if unknown."""
+    return _SOURCE_MODE_MAP.get(value)
+
+
+def _map_output_mode(value: str | None) -> str | None:
+    """Map a raw output mode code to its label, or None if unknown."""
+    return _OUTPUT_MODE_MAP.get(value)
+
 
 class BaseOperationalState(BaseModel):
     """Represents the device operational state."""
@@ -48,14 +92,18 @@ class BaseOperationalState(BaseModel):
         "use_enum_values": True,
     }
 
-    STATE_STATUS_MAPPING: ClassVar[dict[str, StateStatus]] = {
+    STATE_STATUS_MAPPING: ClassVar[dict[str | int, StateStatus]] = {
+        1: StateStatus.ENABLED,
+        0: StateStatus.DISABLED,
         "1": StateStatus.ENABLED,
         "0": StateStatus.DISABLED,
         "Enabled": StateStatus.ENABLED,
         "Disabled": StateStatus.DISABLED,
     }
 
-    DEVICE_STATUS_MAPPING: ClassVar[dict[str, DeviceStatus]] = {
+    DEVICE_STATUS_MAPPING: ClassVar[dict[str | int, DeviceStatus]] = {
+        1: DeviceStatus.ACTIVE,
+        0: DeviceStatus.STANDBY,
         "1": DeviceStatus.ACTIVE,
         "0": DeviceStatus.STANDBY,
         "Active": DeviceStatus.ACTIVE,
@@ -70,19 +118,16 @@ class BaseOperationalState(BaseModel):
         """Convert string/number values to corresponding Enums dynamically, allowing None."""
         if value is None:
             return None
+        if isinstance(value, (StateStatus, DeviceStatus)):
+            return value
 
         field_name = info.field_name
+        mapping = _STATUS_FIELD_MAPPINGS.get(field_name, _DEV_MAP)
 
-        mapping = (
-            cls.STATE_STATUS_MAPPING
-            if field_name in {"auto_aspect", "game_mode"}
-            else cls.DEVICE_STATUS_MAPPING
-        )
-
-        if isinstance(value, (int, str)) and str(value) in mapping:
-            return mapping[str(value)]
-        if isinstance(value, (StateStatus, DeviceStatus)):
-            return value
+        if isinstance(value, (int, str)) and not isinstance(value, bool):
+            result = mapping.get(value)
+            if result is not None:
+                return result
 
         raise ValueError(
             f"Invalid value: {value} for {field_name}. "
@@ -90,6 +135,15 @@ class BaseOperationalState(BaseModel):
         )
 
 
+_STATE_MAP = BaseOperationalState.STATE_STATUS_MAPPING
+_DEV_MAP = BaseOperationalState.DEVICE_STATUS_MAPPING
+_STATUS_FIELD_MAPPINGS: dict[str, dict[str | int, StateStatus | DeviceStatus]] = {
+    "auto_aspect": _STATE_MAP,
+    "game_mode": _STATE_MAP,
+    "device_status": _DEV_MAP,
+}
+
+
 class BaseDeviceId(BaseModel):
     """Represents the base device identification information.
 
@@ -197,7 +251,9 @@ class BaseInputVideo(BaseModel):
         ),
     ] = None
     input_interlaced: Annotated[
-        str | None, Field(alias="field.4", title="Interlaced")
+        str | None,
+        Field(alias="field.4", title="Interlaced"),
+        BeforeValidator(_map_interlaced),
     ] = None
     input_3d_type: Annotated[
         Frame3DTypeEnum | None, Field(alias="field.5", title="Input 3D Type")
@@ -228,15 +284,6 @@ class BaseInputVideo(BaseModel):
 
         raise ValueError(f"Invalid type for vertical_rate: {type(value).__name__}")
 
-    @field_validator("input_interlaced", mode="before")
-    @classmethod
-    def validate_input_interlaced(cls, value: str) -> str:
-        """Validate and map `input_interlaced` based on the Lookup map."""
-        lookup_map = {"1": "Interlaced", "0": "Progressive"}
-        if value not in lookup_map:
-            return value
-        return lookup_map[value]
-
     model_config = {
         "populate_by_name": True,
         "use_enum_values": False,
@@ -278,7 +325,11 @@ class BaseFullInfo(BaseModel):
         int | None, Field(alias="field.6", title="Content Aspect")
     ] = None
 
-    nls_active: Annotated[str | None, Field(alias="field.7", title="NLS Active")] = None
+    nls_active: Annotated[
+        str | None,
+        Field(alias="field.7", title="NLS Active"),
+        BeforeValidator(_map_nls_active),
+    ] = None
 
     output_3d_mode: Annotated[
         Frame3DTypeEnum | None, Field(alias="field.8", title="Output 3D Mode")
@@ -314,16 +365,22 @@ class BaseFullInfo(BaseModel):
     ] = None
 
     source_dynamic_range: Annotated[
-        str | None, Field(alias="field.16", title="Current Input Dynamic Range")
+        str | None,
+        Field(alias="field.16", title="Current Input Dynamic Range"),
+        BeforeValidator(_map_source_dynamic_range),
     ] = None
 
     source_mode: Annotated[
-        str | None, Field(alias="field.17", title="Current Input Mode")
+        str | None,
+        Field(alias="field.17", title="Current Input Mode"),
+        BeforeValidator(_map_source_mode),
     ] = None
 
-    output_mode: Annotated[str | None, Field(alias="field.18", title="Output Mode")] = (
-        None
-    )
+    output_mode: Annotated[
+        str | None,
+        Field(alias="field.18", title="Output Mode"),
+        BeforeValidator(_map_output_mode),
+    ] = None
 
     # Additional V3 attributes
     virtual_input_selected: Annotated[
@@ -352,9 +409,8 @@ class BaseFullInfo(BaseModel):
     @classmethod
     def validate_vertical_rate(cls, value: str) -> float:
         """If value is '059', change it to 59.94; otherwise, convert it to a float."""
-        if value == "059":
-            return 59.94
-        return float(value)
+        special = _VR_SPECIAL.get(value)
+        return special if special is not None else float(value)
 
     @field_validator("output_on", mode="before")
     @classmethod
@@ -376,15 +432,6 @@ class BaseFullInfo(BaseModel):
             for i, bit in enumerate(reversed(binary[:4]))
         }
 
-    @field_validator("nls_active", mode="before")
-    @classmethod
-    def validate_nls_active(cls, value: str) -> str:
-        """Validate and map `nls_active` based on the Lookup map."""
-        lookup_map = {"-": "Normal", "N": "NLS"}
-        if value not in lookup_map:
-            return None
-        return lookup_map[value]
-
     @field_validator("output_colorspace", mode="before")
     @classmethod
     def validate_output_colorspace(cls, value: str) -> int:
@@ -398,33 +445,6 @@ class BaseFullInfo(BaseModel):
             )
         return value_map[value]
 
-    @field_validator("source_dynamic_range", mode="before")
-    @classmethod
-    def validate_source_dynamic_range(cls, value: str) -> str:
-        """Validate and map `source_dynamic_range` based on the Lookup map."""
-        lookup_map = {"0": "SDR", "1": "HDR"}
-        if value not in lookup_map:
-            return None
-        return lookup_map[value]
-
-    @field_validator("source_mode", mode="before")
-    @classmethod
-    def validate_source_mode(cls, value: str) -> str:
-        """Validate and map `source_mode` based on the Lookup map."""
-        lookup_map = {"i": "Interlaced", "p": "Progressive", "n": "No Source"}
-        if value not in lookup_map:
-            return None
-        return lookup_map[value]
-
-    @field_validator("output_mode", mode="before")
-    @classmethod
-    def validate_output_mode(cls, value: str) -> str:
-        """Validate and map `output_mode` based on the Lookup map."""
-        lookup_map = {"I": "Interlaced", "P": "Progressive"}
-        if value not in lookup_map:
-            return None
-        return lookup_map[value]
-
 
 class BaseOutputBasicInfo(BaseModel):
     """Represents basic output information.
@@ -564,7 +584,9 @@ class BaseOutputMode(BaseModel):
         int | None, Field(alias="field.2", title="Vertical Resolution")
     ] = None
     output_interlaced: Annotated[
-        str | None, Field(alias="field.3", title="Interlaced")
+        str | None,
+        Field(alias="field.3", title="Interlaced"),
+        BeforeValidator(_map_interlaced),
     ] = None
     output_3d_mode: Annotated[
         Frame3DTypeEnum | None, Field(alias="field.4", title="3D Mode")
@@ -597,17 +619,9 @@ class BaseOutputMode(BaseModel):
 
         raise ValueError(f"Invalid type for vertical_rate: {type(value).__name__}")
 
-    @field_validator("output_interlaced", mode="before")
-    @classmethod
-    def validate_output_interlaced(cls, value: str) -> str:
-        """Validate and map `output_interlaced` based on the Lookup map."""
-        lookup_map = {"1": "Interlaced", "0": "Progressive"}
-        if value not in lookup_map:
-            return value
-        return lookup_map[value]
-
 
-class DeviceInfo(BaseModel):
+@dataclass(slots=True)
+class DeviceInfo:
     """A structured model for device information with validation and serialization."""
 
     active_input_config_number: int | None = Field(
@@ -672,7 +686,30 @@ class DeviceInfo(BaseModel):
 
     virtual_input_selected: int | None = None
 
-    model_config = {
-        "populate_by_name": True,
-        "use_enum_values": True,
-    }
+    # BaseModel-compatible surface, kept for callers of the former DeviceInfo model.
+    model_fields: ClassVar[dict[str, FieldInfo]]
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        """Return the device information as a dictionary.
+
+        Accepts the same keyword arguments as `BaseModel.model_dump`.
+        """
+        return _DEVICE_INFO_ADAPTER.dump_python(self, **kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Return the device information as a JSON string.
+
+        Accepts the same keyword arguments as `BaseModel.model_dump_json`.
+        """
+        return _DEVICE_INFO_ADAPTER.dump_json(self, **kwargs).decode()
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> "DeviceInfo":
+        """Return a copy of the device information, with `update` applied."""
+        source = copy.deepcopy(self) if deep else self
+        return replace(source, **(update or {}))
+
+
+DeviceInfo.model_fields = DeviceInfo.__pydantic_fields__
+_DEVICE_INFO_ADAPTER = TypeAdapter(DeviceInfo)
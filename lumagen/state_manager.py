@@ -5,9 +5,10 @@ information in a structured manner. It includes device status, input/output sett
 and full device information, with mechanisms to track updates and avoid redundant changes.
 """
 
-from collections.abc import Callable
-from dataclasses import dataclass, field
-from typing import Any
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from typing import Any, ClassVar
 
 from pydantic import BaseModel
 
@@ -23,40 +24,58 @@ from .models import (
 )
 from .utils import LoggingMixin, flatten_dictionary
 
+_FLAT_KEYS: tuple[str, ...] = tuple(f.name for f in fields(DeviceInfo))
+
 
 @dataclass
 class Cache:
     """Encapsulates caching logic for SystemState."""
 
-    data: dict[str, dict] = field(default_factory=dict)
+    data: dict[str, BaseModel] = field(default_factory=dict)
     device_info: DeviceInfo = field(default_factory=DeviceInfo)
+    device_info_flat: dict[str, Any] | None = None
+    submodel_dumps: dict[str, dict[str, Any]] = field(default_factory=dict)
+    flat: dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass
 class SystemState(LoggingMixin):
     """A class to encapsulate the system state with caching for all attributes."""
 
+    # State model names in sorted order; this is also the flatten precedence.
+    _MODEL_FACTORIES: ClassVar[tuple[tuple[str, type[BaseModel]], ...]] = (
+        ("basic_input_info", BaseInputBasicInfo),
+        ("basic_output_info", BaseOutputBasicInfo),
+        ("device_id", BaseDeviceId),
+        ("full_info", BaseFullInfo),
+        ("input_video", BaseInputVideo),
+        ("operational_state", BaseOperationalState),
+        ("output_mode", BaseOutputMode),
+    )
+    _STATE_KEYS: ClassVar[tuple[str, ...]] = tuple(dict(_MODEL_FACTORIES))
+
     _cache: Cache = field(default_factory=Cache, init=False, repr=False)
 
     _update_callback: Callable[[DeviceInfo], None] | None = field(
         default=None, init=False, repr=False, compare=False
     )
 
+    _batching: bool = field(default=False, init=False, repr=False, compare=False)
+    _dirty: bool = field(default=False, init=False, repr=False, compare=False)
+
     state_models: dict[str, BaseModel] = field(
-        default_factory=lambda: {
-            "basic_input_info": BaseInputBasicInfo(),
-            "basic_output_info": BaseOutputBasicInfo(),
-            "device_id": BaseDeviceId(),
-            "full_info": BaseFullInfo(),
-            "input_video": BaseInputVideo(),
-            "operational_state": BaseOperationalState(),
-            "output_mode": BaseOutputMode(),
-        }
+        default_factory=lambda: SystemState._build_defaults()  # noqa: SLF001
     )
 
     def __post_init__(self) -> None:
         """Ensure LoggingMixin is properly initialized."""
         super().__init__()
+        self._rebuild_flat_cache()
+
+    @classmethod
+    def _build_defaults(cls) -> dict[str, BaseModel]:
+        """Build default state models without running validation."""
+        return {name: model.model_construct() for name, model in cls._MODEL_FACTORIES}
 
     @property
     def basic_input_info(self) -> BaseInputBasicInfo:
@@ -107,18 +126,12 @@ class SystemState(LoggingMixin):
         """Reset the system state to default values."""
         self.log.info("Resetting system state to default values.")
 
-        self.state_models = {
-            "basic_input_info": BaseInputBasicInfo(),
-            "basic_output_info": BaseOutputBasicInfo(),
-            "device_id": BaseDeviceId(),
-            "full_info": BaseFullInfo(),
-            "input_video": BaseInputVideo(),
-            "operational_state": BaseOperationalState(),
-            "output_mode": BaseOutputMode(),
-        }
+        self.state_models = self._build_defaults()
 
         self._cache.data.clear()
         self._cache.device_info = DeviceInfo()
+        self._cache.device_info_flat = None
+        self._rebuild_flat_cache()
 
         if update:
             self._update_device_info()
@@ -127,25 +140,21 @@ class SystemState(LoggingMixin):
         """Update method for caching and preventing unnecessary updates."""
 
         if field_name in self.state_models:
-            new_value_dict = (
-                new_value.model_dump()
-                if isinstance(new_value, BaseModel)
-                else new_value
-            )
-
             cache_key = f"_cached_{field_name}"
-            if self._cache.data.get(cache_key, {}) == new_value_dict:
+            cached = self._cache.data.get(cache_key)
+            if cached is not None and (cached is new_value or cached == new_value):
                 return False
 
             self.state_models[field_name] = new_value
-            self._cache.data[cache_key] = new_value_dict
+            self._cache.data[cache_key] = new_value
 
+            self._patch_flat_cache(field_name)
             self._update_device_info()
             return True
 
         if hasattr(self, field_name):
             old_value = getattr(self, field_name)
-            if old_value == new_value:
+            if old_value is new_value or old_value == new_value:
                 return False
 
             setattr(self, field_name, new_value)
@@ -155,51 +164,122 @@ class SystemState(LoggingMixin):
         self.log.warning("Attempted to update unknown field: %s", field_name)
         return False
 
+    @contextmanager
+    def _batch_updates(self) -> Iterator[None]:
+        """Defer `DeviceInfo` rebuilds until the outermost batch completes."""
+        if self._batching:
+            yield
+            return
+
+        self._batching = True
+        try:
+            yield
+        finally:
+            self._batching = False
+            if self._dirty:
+                self._dirty = False
+                self._update_device_info()
+
     def update_state(self, **kwargs) -> bool:
         """Batch update multiple attributes and return True if any value changed."""
         changes_detected = False
 
-        for field_name, new_value in kwargs.items():
-            if hasattr(self, field_name):
-                if self._update_field(field_name, new_value):
-                    changes_detected = True
+        with self._batch_updates():
+            for field_name, new_value in kwargs.items():
+                if hasattr(self, field_name):
+                    if self._update_field(field_name, new_value):
+                        changes_detected = True
 
         return changes_detected
 
     def update_full_info(self, new_info: BaseFullInfo) -> bool:
-        """Update full_info only if it has changed."""
-        filtered_update = {
-            k: v for k, v in new_info.model_dump().items() if v is not None
-        }
+        """Update full_info only if its merged content has changed."""
+        filtered_update = new_info.model_dump(exclude_none=True)
 
         updated_full_info = self.state_models["full_info"].model_copy(
             update=filtered_update
         )
 
-        if self._update_field("full_info", updated_full_info):
-            self._update_device_info()
-            return True
+        with self._batch_updates():
+            if self._update_field("full_info", updated_full_info):
+                return True
         return False
 
+    @staticmethod
+    def _flatten_model(name: str, model: Any) -> dict[str, Any]:
+        """Flatten a single state model the same way `to_dict` output is flattened."""
+        dump = model.model_dump() if isinstance(model, BaseModel) else model
+        return flatten_dictionary({name: dump})
+
+    @staticmethod
+    def _make_flat_scratch() -> dict[str, Any]:
+        """Return a flat dictionary pre-sized with every `DeviceInfo` key."""
+        return dict.fromkeys(_FLAT_KEYS)
+
+    def _rebuild_flat_cache(self) -> None:
+        """Rebuild the flattened state from every state model.
+
+        Models are merged in `_STATE_KEYS` order and the first non-None value
+        for each key wins, matching `flatten_dictionary(self.to_dict())`.
+        """
+        dumps = {
+            name: self._flatten_model(name, self.state_models[name])
+            for name in self._STATE_KEYS
+        }
+        flat = self._make_flat_scratch()
+        for dump in dumps.values():
+            flatten_dictionary(dump, flat)
+
+        self._cache.submodel_dumps = dumps
+        self._cache.flat = flat
+
+    def _patch_flat_cache(self, field_name: str) -> None:
+        """Patch the flattened state with the keys changed by one state model."""
+        dumps = self._cache.submodel_dumps
+        if field_name not in dumps:
+            self._rebuild_flat_cache()
+            return
+
+        old_dump = dumps[field_name]
+        new_dump = self._flatten_model(field_name, self.state_models[field_name])
+        dumps[field_name] = new_dump
+
+        changed = {k for k, v in old_dump.items() if new_dump.get(k) != v}
+        changed.update(k for k, v in new_dump.items() if old_dump.get(k) != v)
+
+        flat = self._cache.flat
+        for key in changed:
+            for dump in dumps.values():
+                if key in dump:
+                    flat[key] = dump[key]
+                    break
+            else:
+                flat[key] = None
+
     def _update_device_info(self) -> None:
         """Merge system state data and update cached `DeviceInfo` instance.
 
-        This method collects all system state attributes, creates a new
-        `DeviceInfo` instance, and updates the cache. If any changes are
-        detected, it dispatches an event.
+        This method builds a new `DeviceInfo` instance from the cached
+        flattened system state and updates the cache. If any changes are
+        detected, it dispatches an event. The rebuild is skipped when the
+        flattened state is unchanged, and deferred until completion inside a
+        batch.
         """
+        if self._batching:
+            self._dirty = True
+            return
 
-        merged_dict = flatten_dictionary(self.to_dict())
-        new_device_info = DeviceInfo(**merged_dict)
+        cache = self._cache
+        flat = cache.flat
+        if flat == cache.device_info_flat:
+            return
 
-        if self._cache.device_info != new_device_info:
-            self._cache.device_info = new_device_info
-            if self._update_callback is not None:
-                self._update_callback(new_device_info)
+        cache.device_info_flat = flat.copy()
+        cache.device_info = DeviceInfo(**flat)
+        if self._update_callback is not None:
+            self._update_callback(cache.device_info)
 
     def to_dict(self) -> dict:
         """Convert the SystemState instance into a sorted dictionary."""
-        unsorted_dict = {
-            **{k: v.model_dump() for k, v in self.state_models.items()},
-        }
-        return dict(sorted(unsorted_dict.items()))
+        state_models = self.state_models
+        return {k: state_models[k].model_dump() for k in self._STATE_KEYS}
@@ -19,8 +19,9 @@ Dependencies:
 import asyncio
 from collections.abc import Coroutine
 from enum import Enum
-import inspect
 import logging
+import re
+import sys
 from typing import Any, Protocol
 
 
@@ -28,7 +29,8 @@ class BufferManager:
     """Manage a data buffer in a streaming context.
 
     This class provides utility methods for handling a buffer, extracting messages,
-    and checking for specific conditions like prefixes or terminators.
+    and checking for specific conditions like prefixes or terminators. Data is
+    accumulated in a `bytearray`; the `buffer` property exposes it as a string.
     """
 
     def __init__(self, terminator: str = "\n", ignored_prefixes: tuple = ()) -> None:
@@ -43,16 +45,40 @@ class BufferManager:
         """
         self.terminator = terminator
         self.ignored_prefixes = ignored_prefixes
-        self.buffer = ""
-
-    def append(self, data: str) -> None:
+        self._buffer = bytearray()
+        self._prefix_cache: dict[tuple, tuple[tuple[bytes, ...], int]] = {}
+        self._keyword_patterns: dict[tuple, re.Pattern[bytes]] = {}
+
+    @property
+    def buffer(self) -> str:
+        """Return the buffered data as a string."""
+        return self._buffer.decode("utf-8")
+
+    @buffer.setter
+    def buffer(self, value: str) -> None:
+        """Replace the buffered data."""
+        self._buffer = bytearray(value.encode("utf-8"))
+
+    @property
+    def terminator(self) -> str:
+        """Return the message terminator."""
+        return self._terminator
+
+    @terminator.setter
+    def terminator(self, value: str) -> None:
+        """Set the message terminator."""
+        self._terminator = value
+        self._terminator_bytes = value.encode("utf-8")
+
+    def append(self, data: str | bytes) -> None:
         """Append data to the buffer.
 
         Args:
-            data (str): The data to append to the buffer.
+            data (str | bytes): The data to append to the buffer. Bytes read from
+                                the stream are stored as-is, without decoding.
 
         """
-        self.buffer += data
+        self._buffer += data.encode("utf-8") if isinstance(data, str) else data
 
     def extract_message(self) -> str:
         """Extract a complete message from the buffer and update the buffer.
@@ -64,16 +90,18 @@ class BufferManager:
                  Returns an empty string if no complete message is available.
 
         """
-        end_idx = self.buffer.find(self.terminator) + len(self.terminator)
+        end_idx = self._buffer.find(self._terminator_bytes) + len(
+            self._terminator_bytes
+        )
         if end_idx > 0:
-            message = self.buffer[:end_idx]
-            self.buffer = self.buffer[end_idx:]
+            message = self._buffer[:end_idx].decode("utf-8")
+            del self._buffer[:end_idx]
             return message.strip()
         return ""
 
     def clear(self) -> None:
         """Clear the buffer by removing all its contents."""
-        self.buffer = ""
+        self._buffer.clear()
 
     def starts_with(self, prefixes: tuple) -> bool:
         """Check if the buffer starts with any of the specified prefixes.
@@ -85,9 +113,14 @@ class BufferManager:
             bool: True if the buffer starts with one of the prefixes, False otherwise.
 
         """
-        return self.buffer.lower().startswith(
-            tuple(prefix.lower() for prefix in prefixes)
-        )
+        cached = self._prefix_cache.get(prefixes)
+        if cached is None:
+            lowered = tuple(prefix.lower().encode("utf-8") for prefix in prefixes)
+            cached = (lowered, max(map(len, lowered), default=0))
+            self._prefix_cache[prefixes] = cached
+
+        lowered, max_len = cached
+        return self._buffer[:max_len].lower().startswith(lowered)
 
     def ends_with_terminator(self) -> bool:
         """Check if the buffer ends with the terminator.
@@ -96,7 +129,7 @@ class BufferManager:
             bool: True if the buffer ends with the terminator, False otherwise.
 
         """
-        return self.buffer.endswith(self.terminator)
+        return self._buffer.endswith(self._terminator_bytes)
 
     def is_empty(self) -> bool:
         """Check if the buffer is empty or contains only whitespace.
@@ -105,27 +138,49 @@ class BufferManager:
             bool: True if the buffer is empty or contains only whitespace, False otherwise.
 
         """
-        return not self.buffer.strip()
+        return not self._buffer.strip()
 
-    def adjust_buffer(self, keywords: list[str]) -> None:
-        """Modify the buffer to start from the first detected keyword."""
-        buffer_lower = self.buffer.lower()
-        for keyword in keywords:
-            start_idx = buffer_lower.find(keyword.lower())
+    def adjust_buffer(self, keywords: list[str] | tuple[str, ...]) -> None:
+        """Modify the buffer to start from the first detected keyword.
 
-            if start_idx != -1:
-                # Special case: If buffer is exactly "#!", do not modify it
-                if (
-                    keyword == "!"
-                    and start_idx == 1
-                    and self.buffer[start_idx - 1] == "#"
-                    and len(self.buffer) == 2
-                ):
-                    return
+        Keywords are matched case-insensitively and in priority order: the
+        earliest occurrence of the first keyword in `keywords` found anywhere
+        in the buffer wins. All keywords are located in a single scan.
+        """
+        key = tuple(keywords)  # No copy when a tuple is passed in.
+        pattern = self._keyword_patterns.get(key)
+        if pattern is None:
+            # One capturing group per keyword inside a lookahead, so every
+            # position reports the highest-priority keyword starting there.
+            alternatives = b"|".join(
+                b"(" + re.escape(keyword.encode("utf-8")) + b")" for keyword in key
+            )
+            pattern = re.compile(b"(?=" + alternatives + b")", re.IGNORECASE)
+            self._keyword_patterns[key] = pattern
+
+        best_group = 0
+        start_idx = -1
+        for match in pattern.finditer(self._buffer):
+            group = match.lastindex
+            if not best_group or group < best_group:
+                best_group, start_idx = group, match.start()
+                if group == 1:
+                    break
+
+        if not best_group:
+            return
+
+        # Special case: If buffer is exactly "#!", do not modify it
+        if (
+            key[best_group - 1] == "!"
+            and start_idx == 1
+            and self._buffer[start_idx - 1] == ord("#")
+            and len(self._buffer) == 2
+        ):
+            return
 
-                # Adjust the buffer to start from the keyword
-                self.buffer = self.buffer[start_idx:]
-                return
+        # Adjust the buffer to start from the keyword
+        del self._buffer[:start_idx]
 
 
 class LogProtocol(Protocol):
@@ -173,40 +228,31 @@ class LoggingMixin:
         """Initialize the logger for the current module."""
         super().__init__()
         self.logger = logging.getLogger(self.__class__.__module__)
+        self._log_extra = {"classname": self.__class__.__name__}
+        self.log = LogProxy(self)
 
     def log_debug(self, message: str, *args: Any) -> None:
         """Log a debug message only if debug logging is enabled."""
-        if not LoggingMixin._disable_debug_logging:
-            self.logger.debug(
-                message,
-                *args,
-                extra={"classname": self.__class__.__name__},
-                stacklevel=3,
-            )
+        if not LoggingMixin._disable_debug_logging and self.logger.isEnabledFor(
+            logging.DEBUG
+        ):
+            self.logger.debug(message, *args, extra=self._log_extra, stacklevel=3)
 
     def log_info(self, message: str, *args: Any) -> None:
         """Log an info message."""
-        self.logger.info(
-            message, *args, extra={"classname": self.__class__.__name__}, stacklevel=3
-        )
+        self.logger.info(message, *args, extra=self._log_extra, stacklevel=3)
 
     def log_warning(self, message: str, *args: Any) -> None:
         """Log a warning message."""
-        self.logger.warning(
-            message, *args, extra={"classname": self.__class__.__name__}, stacklevel=3
-        )
+        self.logger.warning(message, *args, extra=self._log_extra, stacklevel=3)
 
     def log_error(self, message: str, *args: Any) -> None:
         """Log an error message."""
-        self.logger.error(
-            message, *args, extra={"classname": self.__class__.__name__}, stacklevel=3
-        )
+        self.logger.error(message, *args, extra=self._log_extra, stacklevel=3)
 
     def log_critical(self, message: str, *args: Any) -> None:
         """Log a critical message."""
-        self.logger.critical(
-            message, *args, extra={"classname": self.__class__.__name__}, stacklevel=3
-        )
+        self.logger.critical(message, *args, extra=self._log_extra, stacklevel=3)
 
     @classmethod
     def disable_debug_logging(cls) -> None:
@@ -219,9 +265,11 @@ class LoggingMixin:
         cls._disable_debug_logging = False
 
     def __getattr__(self, name: str) -> Any:
-        """Provide dynamic access to the log property."""
+        """Provide the log proxy for instances that skipped `__init__`."""
         if name == "log":
-            return LogProxy(self)
+            proxy = LogProxy(self)
+            self.__dict__["log"] = proxy
+            return proxy
         raise AttributeError(
             f"'{self.__class__.__name__}' object has no attribute '{name}'"
         )
@@ -242,25 +290,42 @@ class LogProxy:
         except AttributeError as e:
             raise AttributeError(f"No log method for level '{log_level}'") from e
 
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802
+        """Return True if a message at `level` would be emitted."""
+        debug_disabled = LoggingMixin._disable_debug_logging  # noqa: SLF001
+        if level <= logging.DEBUG and debug_disabled:
+            return False
+        logger = getattr(self.base_instance, "logger", None)
+        return logger is None or logger.isEnabledFor(level)
+
+    def log(self, level: int, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a message at the given numeric level."""
+        log_level = logging.getLevelName(level).lower()
+        try:
+            log_method = getattr(self.base_instance, f"log_{log_level}")
+        except AttributeError as e:
+            raise AttributeError(f"No log method for level '{log_level}'") from e
+        log_method(msg, *args, **kwargs)
+
     def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log a debug message."""
-        getattr(self.base_instance, "log_debug")(msg, *args, **kwargs)
+        self.base_instance.log_debug(msg, *args, **kwargs)
 
     def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log an informational message."""
-        getattr(self.base_instance, "log_info")(msg, *args, **kwargs)
+        self.base_instance.log_info(msg, *args, **kwargs)
 
     def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log a warning message."""
-        getattr(self.base_instance, "log_warning")(msg, *args, **kwargs)
+        self.base_instance.log_warning(msg, *args, **kwargs)
 
     def error(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log an error message."""
-        getattr(self.base_instance, "log_error")(msg, *args, **kwargs)
+        self.base_instance.log_error(msg, *args, **kwargs)
 
     def critical(self, msg: str, *args: Any, **kwargs: Any) -> None:
         """Log a critical message."""
-        getattr(self.base_instance, "log_critical")(msg, *args, **kwargs)
+        self.base_instance.log_critical(msg, *args, **kwargs)
 
 
 class TaskManager(LoggingMixin):
@@ -282,12 +347,19 @@ class TaskManager(LoggingMixin):
 
         task = asyncio.create_task(coro, name=name)
 
-        task.add_done_callback(lambda t: self._handle_task_completion(t, name))
+        task.add_done_callback(self._handle_task_completion)
         self.active_tasks[name] = task
         return task
 
-    def _handle_task_completion(self, task: asyncio.Task, name: str) -> None:
-        """Remove completed tasks and log any errors or cancellations."""
+    def _handle_task_completion(
+        self, task: asyncio.Task, name: str | None = None
+    ) -> None:
+        """Remove completed tasks and log any errors or cancellations.
+
+        The task is looked up by `name`, defaulting to the task's own name.
+        """
+        if name is None:
+            name = task.get_name()
         self.active_tasks.pop(name, None)
 
         if task.cancelled():
@@ -315,15 +387,14 @@ class TaskManager(LoggingMixin):
         """Cancel all tasks managed by the TaskManager."""
 
         # Log the caller module, class, and function.
-        stack = inspect.stack()[1]
-        caller_module = inspect.getmodule(stack.frame).__name__.split(".")[1]
+        frame = sys._getframe(1)  # noqa: SLF001
+        caller_module = frame.f_globals.get("__name__", "?").rsplit(".", 1)[-1]
+        caller_self = frame.f_locals.get("self")
         caller_class = (
-            stack.frame.f_locals["self"].__class__.__name__
-            if "self" in stack.frame.f_locals
-            else "Unknown"
+            caller_self.__class__.__name__ if caller_self is not None else "Unknown"
         )
 
-        caller_function = stack.function
+        caller_function = frame.f_code.co_name
 
         self.log.info(
             "TaskManager.cancel_all_tasks() called by: %s.%s.%s",
@@ -358,60 +429,77 @@ class TaskManager(LoggingMixin):
 
 
 def custom_log_pprint(
-    data: dict | list | str, log_method: callable, indent: int = 0
+    data: dict | list | str,
+    logger: Any,
+    level: int = logging.DEBUG,
+    indent: int = 0,
 ) -> None:
-    """Pretty-print dictionaries and lists using the specified logging method."""
-
-    def format_data(value: dict | list | str | float | bool, level: int) -> str:
-        """Format nested data (dicts, lists, and other types) with proper indentation."""
-        if isinstance(value, dict):
-            return format_nested_dict(value, level)
+    """Pretty-print dictionaries and lists to a logger at the given level.
 
-        if isinstance(value, list):
-            return format_list(value, level)
-
-        if isinstance(value, str):
-            return f"'{value}'"
+    `logger` may be a `logging.Logger` or a `LogProxy`. Nothing is formatted
+    when the level is disabled.
+    """
+    if not logger.isEnabledFor(level):
+        return
 
-        return str(value)
+    # All fragments go into one list that is joined once at the end.
+    parts = ["\n"]
+    write = parts.append
 
-    def format_nested_dict(d: dict, level: int = 0) -> str:
-        """Recursively format nested dictionaries with indentation."""
+    def write_data(value: dict | list | str | float | bool, level: int) -> None:
+        """Write nested data (dicts, lists, and other types) with proper indentation."""
+        if isinstance(value, dict):
+            write_nested_dict(value, level)
+        elif isinstance(value, list):
+            write_list(value, level)
+        elif isinstance(value, str):
+            write(f"'{value}'")
+        else:
+            write(str(value))
+
+    def write_nested_dict(d: dict, level: int = 0) -> None:
+        """Recursively write nested dictionaries with indentation."""
         spaces = "    " * level
-        formatted = f"{spaces}{{\n"
+        write(f"{spaces}{{\n")
         for key, value in d.items():
-            formatted += f"{spaces}    '{key}': {format_data(value, level + 1)},\n"
-        formatted += f"{spaces}}}"
-        return formatted
+            write(f"{spaces}    '{key}': ")
+            write_data(value, level + 1)
+            write(",\n")
+        write(f"{spaces}}}")
 
-    def format_list(lst: list, level: int = 0) -> str:
-        """Recursively format lists with correct indentation (exactly 4 spaces per item)."""
+    def write_list(lst: list, level: int = 0) -> None:
+        """Recursively write lists with correct indentation (exactly 4 spaces per item)."""
         spaces = "    " * level
         item_indent = "    " * (level + 1)
-
-        formatted = f"{spaces}[\n"
+        write(f"{spaces}[\n")
         for item in lst:
-            formatted += f"{item_indent}{format_data(item, 0)},\n"
-        formatted += f"{spaces}]"
-        return formatted
+            write(item_indent)
+            write_data(item, 0)
+            write(",\n")
+        write(f"{spaces}]")
 
-    formatted_output = (
-        format_list(data, indent)
-        if isinstance(data, list)
-        else format_data(data, indent)
-    )
+    if isinstance(data, list):
+        write_list(data, indent)
+    else:
+        write_data(data, indent)
 
-    log_method("\n" + formatted_output)
+    logger.log(level, "".join(parts))
 
 
 def process_command_or_keypress(
-    buffer: str, my_dict: dict[str, str]
+    buffer: str,
+    my_dict: dict[str, str],
+    key_lengths: tuple[int, ...] | None = None,
 ) -> tuple[str | None, str | None, bool]:
     """Check if the buffer matches a command or keypress in the dictionary.
 
     Args:
         buffer (str): The current buffer to check.
         my_dict (dict): The dictionary of commands or keypress mappings.
+        key_lengths (tuple[int, ...] | None): The distinct key lengths of
+            `my_dict`, longest first. When given, the buffer is matched with one
+            dictionary lookup per length (longest matching key wins) instead of
+            scanning every key.
 
     Returns:
         tuple: (key, value, is_keypress) where:
@@ -420,38 +508,75 @@ def process_command_or_keypress(
             - is_keypress (bool): True if it's a keypress, False otherwise.
 
     """
+    # Command starts with "#" + key; keypress starts directly with key.
+    stripped = buffer.removeprefix("#")
+    is_keypress = stripped is buffer
+    if key_lengths is not None:
+        for length in key_lengths:
+            key = stripped[:length]
+            if key in my_dict:
+                return key, my_dict[key], is_keypress
+        return None, None, False
     for key, value in my_dict.items():
-        if buffer.startswith("#" + key):  # Command starts with "#" + key
-            return key, value, False
-        if buffer.startswith(key):  # Keypress starts directly with key
-            return key, value, True
+        if stripped.startswith(key):
+            return key, value, is_keypress
     return None, None, False
 
 
+# Leaf types stored as-is by `flatten_dictionary` without further type checks.
+_FLATTEN_LEAF_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# str() of each Enum member seen by flatten_dictionary, keyed by (class, member)
+# because IntEnum members of different classes hash and compare equal by value.
+# Bounded by the number of enum members in use.
+_ENUM_STRINGS: dict[tuple[type, Enum], str] = {}
+
+
 def flatten_dictionary(d: dict, merged=None) -> dict:
-    """Recursively flattens a nested dictionary, merging all values into a single dictionary.
+    """Flatten a nested dictionary, merging all values into a single dictionary.
+
+    Nested dictionaries are walked depth-first in insertion order using an
+    explicit stack; the first non-None value seen for a key wins. Keys in
+    `merged` that hold None are treated as unset, so a pre-sized scratch
+    dictionary can be passed in.
 
     Args:
         d (dict): The dictionary to flatten.
         merged (dict, optional): The dictionary to store merged values. Defaults to a new dict.
 
     Returns:
-        dict: A sorted flattened dictionary with all nested values merged.
+        dict: A flattened dictionary with all nested values merged.
 
     """
     if merged is None:
         merged = {}
 
-    for key, value in d.items():
-        if isinstance(value, dict):
-            flatten_dictionary(value, merged)
-            continue
-
-        # Convert all Enum instances to their string representation
-        if isinstance(value, Enum):
-            value = str(value)  # Uses the `__str__()` method of the Enum
-
-        if key not in merged and value is not None:
-            merged[key] = value
-
-    return dict(sorted(merged.items()))
+    # Bind hot lookups to locals; this loop runs on every state update.
+    leaf_types = _FLATTEN_LEAF_TYPES
+    enum_strings = _ENUM_STRINGS
+    merged_get = merged.get
+    stack = [iter(d.items())]
+    push = stack.append
+    pop = stack.pop
+    while stack:
+        for key, value in stack[-1]:
+            if type(value) not in leaf_types:
+                if isinstance(value, dict):
+                    push(iter(value.items()))
+                    break
+
+                # Convert all Enum instances to their string representation
+                if isinstance(value, Enum):
+                    cache_key = (type(value), value)
+                    text = enum_strings.get(cache_key)
+                    if text is None:
+                        # Uses the `__str__()` method of the Enum
+                        text = enum_strings[cache_key] = str(value)
+                    value = text
+
+            if value is not None and merged_get(key) is None:
+                merged[key] = value
+        else:
+            pop()
+
+    return merged
@@ -6,13 +6,15 @@ import argparse
 import asyncio
 import logging
 import sys
+import time
 
 from lumagen.constants import DEFAULT_BAUDRATE, DEFAULT_IP_PORT
 from lumagen.device_manager import DeviceManager
 from lumagen.utils import LoggingMixin
 from prompt_toolkit.application import Application
 from prompt_toolkit.clipboard import InMemoryClipboard
-from prompt_toolkit.completion import WordCompleter
+from prompt_toolkit.completion import Completer, Completion, WordCompleter
+from prompt_toolkit.document import Document
 from prompt_toolkit.key_binding import KeyBindings, KeyPressEvent
 from prompt_toolkit.key_binding.bindings.focus import focus_next
 from prompt_toolkit.key_binding.bindings.page_navigation import (
@@ -33,67 +35,211 @@ from prompt_toolkit.styles import Style
 from prompt_toolkit.widgets import SearchToolbar, TextArea
 
 
-# pylint: disable=too-many-arguments, too-many-positional-arguments
-class CustomLogger(logging.Logger):
-    """Custom Logger that adds classname to log records."""
+_COMPLETIONS = (
+    "clear",
+    "get_all",
+    "get_labels",
+    "power_on",
+    "power_off",
+    "save",
+    "show_all",
+    "show_info",
+    "show_labels",
+    "show_source_list",
+    "show_state",
+    "set_labels",
+    "ZQI00",
+    "ZQI01",
+    "ZQI21",
+    "ZQI22",
+    "ZQI23",
+    "ZQI24",
+    "ZQI52",
+    "ZQI53",
+    "ZQI54",
+    "ZQO00",
+    "ZQO01",
+    "ZQO02",
+    "ZQS00",
+    "ZQS01",
+    "ZQS02",
+    "ZQS1A0",
+    "ZQS1A1",
+    "ZQS1A2",
+    "ZQS1A3",
+    "ZQS1A4",
+    "ZQS1A5",
+    "ZQS1A6",
+    "ZY520A",
+)
+
+
+_STYLE = Style(
+    [
+        ("output-field", "bg:#000044 #ffffff"),
+        ("input-field", "bg:#000000 #ffffff"),
+        ("line", "#004400"),
+    ]
+)
+
+_TITLEBAR = [
+    ("class:title", " Lumagen App "),
+    ("class:title", " (Press [Ctrl-C] to exit.)"),
+]
+
+# ZQS1 label queries for label IDs A0-D5 and 10-37.
+_LABEL_QUERIES = tuple(
+    [f"ZQS1{chr(x)}{y}" for x in range(ord("A"), ord("D") + 1) for y in range(6)]
+    + [f"ZQS1{x}{y}" for x in range(1, 4) for y in range(8)]
+)
 
-    def _log(
-        self,
-        level,
-        msg,
-        args,
-        exc_info=None,
-        extra=None,
-        stack_info=False,
-        stacklevel=1,
-    ):
-        if extra is None:
-            extra = {}
-        # Add classname to the extra fields
-        frame = logging.currentframe().f_back.f_back
-        cls_name = frame.f_locals.get("self", None)
-        extra["classname"] = cls_name.__class__.__name__ if cls_name else "N/A"
 
-        super()._log(level, msg, args, exc_info, extra, stack_info, stacklevel)
+class CachedWordCompleter(Completer):
+    """WordCompleter over a fixed word list that memoizes completions per prefix."""
 
+    # Prefixes remembered before the cache is dropped and rebuilt.
+    MAX_CACHED = 256
 
-logging.setLoggerClass(CustomLogger)
+    def __init__(self, words, ignore_case=False) -> None:
+        """Init Class."""
+        self._completer = WordCompleter(list(words), ignore_case=ignore_case)
+        self._cache: dict[str, list[Completion]] = {}
+
+    def get_completions(self, document, complete_event):
+        """Yield completions for the word before the cursor."""
+        word = document.get_word_before_cursor()
+        completions = self._cache.get(word)
+        if completions is None:
+            if len(self._cache) >= self.MAX_CACHED:
+                self._cache.clear()
+            completions = self._cache[word] = list(
+                self._completer.get_completions(document, complete_event)
+            )
+        yield from completions
+
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter that renders the strftime part of asctime once per second."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Init Class."""
+        super().__init__(*args, **kwargs)
+        self._last_second = None
+        self._last_time = ""
+
+    def formatTime(self, record, datefmt=None):  # noqa: N802
+        """Return asctime, reusing the formatted second across records."""
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        if second != self._last_second:
+            self._last_second = second
+            self._last_time = time.strftime(
+                self.default_time_format, self.converter(second)
+            )
+        if self.default_msec_format:
+            return self.default_msec_format % (self._last_time, record.msecs)
+        return self._last_time
 
 
 class CustomLoggingHandler(logging.Handler):
     """A logging handler to output log messages to a prompt_toolkit TextArea."""
 
+    # Pending lines that force an immediate write instead of waiting a loop tick.
+    MAX_PENDING = 32
+
     def __init__(self, output_field) -> None:
         """Init Class."""
         super().__init__()
         self.output_field = output_field
+        self._pending: list[str] = []
+        self._flush_scheduled = False
+        try:
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
 
     def emit(self, record):
-        """Emit."""
-        message = self.format(record)
-        update_text_area(self.output_field, message + "\n")
+        """Queue the record and schedule a single write for the current burst."""
+        try:
+            self._pending.append(self.format(record))
+            loop = self._loop
+            if (
+                loop is None
+                or loop.is_closed()
+                or len(self._pending) > self.MAX_PENDING
+            ):
+                self.flush()
+            elif not self._flush_scheduled:
+                self._flush_scheduled = True
+                loop.call_soon_threadsafe(self.flush)
+        except Exception:  # noqa: BLE001
+            self._flush_scheduled = False
+            self.handleError(record)
+
+    def discard_pending(self):
+        """Drop messages that have not been written to the log area yet."""
+        self.acquire()
+        try:
+            self._pending.clear()
+        finally:
+            self.release()
+
+    def flush(self):
+        """Write all pending messages to the log area in one update."""
+        self.acquire()
+        try:
+            pending, self._pending = self._pending, []
+            self._flush_scheduled = False
+        finally:
+            self.release()
+        if pending:
+            update_text_area(self.output_field, "\n".join(pending) + "\n")
+
+
+# Scrollback kept in the log area; trimmed in chunks so appends stay cheap.
+MAX_OUTPUT_LINES = 5000
+_OUTPUT_TRIM_SLACK = MAX_OUTPUT_LINES // 10
+# Shortest time between two screen repaints (about 60 per second).
+MIN_REDRAW_INTERVAL = 1 / 60
 
 
 # Function to update the log area
 def update_text_area(output_field: TextArea, text):
-    """Update the log area with new text."""
-    output_field.text += text
-    output_field.buffer.cursor_position = len(output_field.text)
+    """Append text to the log area, keeping at most MAX_OUTPUT_LINES lines."""
+    document = output_field.document
+    new_text = document.text + text
+    # line_count is cached on the current Document once it has been rendered,
+    # so only the appended text needs scanning for newlines.
+    line_count = document.line_count + text.count("\n")
+    if line_count > MAX_OUTPUT_LINES + _OUTPUT_TRIM_SLACK:
+        new_text = "\n".join(new_text.split("\n")[-MAX_OUTPUT_LINES - 1 :])
+    # Replace text and cursor in one step instead of two separate updates.
+    output_field.document = Document(new_text, len(new_text))
 
 
 def configure_logging(output_field, log_level):
-    """Set up global logging with CustomLogger and CustomLoggingHandler."""
+    """Set up global logging with CustomLoggingHandler and return the handler.
+
+    LoggingMixin supplies ``classname`` with each record; records from other
+    loggers fall back to "N/A" through the formatter defaults.
+    """
     logging_handler = CustomLoggingHandler(output_field)
+    # Propagated records skip the root logger's level check; filter them on the
+    # handler so they are dropped before formatting.
+    logging_handler.setLevel(log_level)
     logging_handler.setFormatter(
-        logging.Formatter(
+        CachedTimeFormatter(
             "%(asctime)s - %(levelname)s - %(name)s - %(classname)s - "
-            "%(funcName)s - %(message)s"
+            "%(funcName)s - %(message)s",
+            defaults={"classname": "N/A"},
         )
     )
 
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     root_logger.addHandler(logging_handler)
+    return logging_handler
 
 
 class LumagenApp(LoggingMixin):
@@ -124,9 +270,12 @@ class LumagenApp(LoggingMixin):
         """Init."""
         super().__init__()
         self.device: DeviceManager = None
-        self.search_field = SearchToolbar()
+        self.search_field: SearchToolbar = None
         self.output_field: TextArea = None
         self.input_field: TextArea = None
+        self._log_handler: CustomLoggingHandler = None
+        # Entries look up self.device when invoked, after setup_connection.
+        self._commands = self._build_commands()
 
     async def run(self, args):
         "Implement main application logic."
@@ -135,19 +284,17 @@ class LumagenApp(LoggingMixin):
             self._fallback_logger.setLevel(args.log_level)
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setFormatter(
-                logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
+                CachedTimeFormatter("%(asctime)s - %(levelname)s - %(message)s")
             )
             self._fallback_logger.addHandler(console_handler)
 
         try:
             self.setup_ui()
-            configure_logging(self.output_field, log_level=args.log_level)
+            self._log_handler = configure_logging(
+                self.output_field, log_level=args.log_level
+            )
             self.log.debug("Starting Application")
-
-            try:
-                await self.setup_connection()
-            except KeyboardInterrupt:
-                print()  # noqa: T201
+            await self.setup_connection()
 
             application = self.create_application(args)
             await application.run_async()
@@ -163,6 +310,7 @@ class LumagenApp(LoggingMixin):
 
     def setup_ui(self):
         """Set up the UI components."""
+        self.search_field = SearchToolbar()
         self.output_field = TextArea(
             style="class:output-field",
             scrollbar=True,
@@ -185,8 +333,11 @@ class LumagenApp(LoggingMixin):
     async def setup_connection(self):
         """Prompt user for connection settings and return the appropriate connection object."""
         use_ip = (
-            input(
-                "Press Enter to use IP connection (default) or type 's' for Serial connection: "
+            (
+                await asyncio.to_thread(
+                    input,
+                    "Press Enter to use IP connection (default) or type 's' for Serial connection: ",
+                )
             )
             .strip()
             .lower()
@@ -194,21 +345,29 @@ class LumagenApp(LoggingMixin):
 
         if use_ip == "s":
             port = (
-                input("Enter serial port (default /dev/ttyS0): ").strip()
-                or "/dev/ttyS0"
-            )
-            baudrate_input = input(
-                f"Enter baud rate (default {DEFAULT_BAUDRATE}): "
+                await asyncio.to_thread(
+                    input, "Enter serial port (default /dev/ttyS0): "
+                )
+            ).strip() or "/dev/ttyS0"
+            baudrate_input = (
+                await asyncio.to_thread(
+                    input, f"Enter baud rate (default {DEFAULT_BAUDRATE}): "
+                )
             ).strip()
             baudrate = int(baudrate_input) if baudrate_input else DEFAULT_BAUDRATE
             self.device = DeviceManager(connection_type="serial")
             await self.device.open(port=port, baudrate=baudrate)
         else:
             ip = (
-                input("Enter IP address (default 192.168.15.71): ").strip()
-                or "192.168.15.71"
-            )
-            port_input = input(f"Enter port (default {DEFAULT_IP_PORT}): ").strip()
+                await asyncio.to_thread(
+                    input, "Enter IP address (default 192.168.15.71): "
+                )
+            ).strip() or "192.168.15.71"
+            port_input = (
+                await asyncio.to_thread(
+                    input, f"Enter port (default {DEFAULT_IP_PORT}): "
+                )
+            ).strip()
             port = int(port_input) if port_input else DEFAULT_IP_PORT
             self.device = DeviceManager(connection_type="ip")
             await self.device.open(host=ip, port=port)
@@ -220,22 +379,18 @@ class LumagenApp(LoggingMixin):
         return Application(
             layout=Layout(body, focused_element=self.input_field),
             key_bindings=key_bindings,
-            style=Style(
-                [
-                    ("output-field", "bg:#000044 #ffffff"),
-                    ("input-field", "bg:#000000 #ffffff"),
-                    ("line", "#004400"),
-                ]
-            ),
+            style=_STYLE,
             clipboard=InMemoryClipboard(),
             mouse_support=False,
             full_screen=True,
+            # Cap repaints during log bursts; invalidate() already coalesces.
+            min_redraw_interval=MIN_REDRAW_INTERVAL,
         )
 
-    def accept(self, _):
-        """Handle user input and execute the corresponding command."""
-        commands = {
-            "clear": lambda: setattr(self.output_field, "text", ""),
+    def _build_commands(self):
+        """Build the command dispatch table used by accept."""
+        return {
+            "clear": self._clear_output,
             "get_all": lambda: asyncio.create_task(self.device.executor.get_all()),
             "get_labels": lambda: asyncio.create_task(
                 self.device.executor.get_labels()
@@ -257,28 +412,30 @@ class LumagenApp(LoggingMixin):
             "show_state": lambda: asyncio.create_task(self.device.show_power_state()),
             "send_test": lambda: asyncio.create_task(self.device.test_command()),
         }
+
+    def _clear_output(self):
+        """Clear the log area, including lines still waiting to be written."""
+        if self._log_handler is not None:
+            self._log_handler.discard_pending()
+        self.output_field.buffer.reset()
+
+    def accept(self, _):
+        """Handle user input and execute the corresponding command."""
         command = self.input_field.text.strip()
-        action = commands.get(
-            command, lambda: asyncio.create_task(self.device.send_command(command))
-        )
-        action()
+        action = self._commands.get(command)
+        if action is None:
+            asyncio.create_task(self.device.send_command(command))  # noqa: RUF006
+        else:
+            action()
 
     def create_body(self):
         """Create the main body layout for the application."""
-
-        def get_titlebar_text():
-            """Return the formatted text for the title bar."""
-            return [
-                ("class:title", " Lumagen App "),
-                ("class:title", " (Press [Ctrl-C] to exit.)"),
-            ]
-
         return FloatContainer(
             content=HSplit(
                 [
                     Window(
                         height=1,
-                        content=FormattedTextControl(get_titlebar_text),
+                        content=FormattedTextControl(_TITLEBAR),
                         align=WindowAlign.CENTER,
                     ),
                     self.output_field,
@@ -298,55 +455,11 @@ class LumagenApp(LoggingMixin):
 
     def create_completer(self):
         """Create a word completer for input commands."""
-        return WordCompleter(
-            [
-                "clear",
-                "get_all",
-                "get_labels",
-                "power_on",
-                "power_off",
-                "save",
-                "show_all",
-                "show_info",
-                "show_labels",
-                "show_source_list",
-                "show_state",
-                "set_labels",
-                "ZQI00",
-                "ZQI01",
-                "ZQI21",
-                "ZQI22",
-                "ZQI23",
-                "ZQI24",
-                "ZQI52",
-                "ZQI53",
-                "ZQI54",
-                "ZQO00",
-                "ZQO01",
-                "ZQO02",
-                "ZQS00",
-                "ZQS01",
-                "ZQS02",
-                "ZQS1A0",
-                "ZQS1A1",
-                "ZQS1A2",
-                "ZQS1A3",
-                "ZQS1A4",
-                "ZQS1A5",
-                "ZQS1A6",
-                "ZY520A",
-            ],
-            ignore_case=False,
-        )
+        return CachedWordCompleter(_COMPLETIONS, ignore_case=False)
 
     async def query_labels(self):
         """Send label query commands for all relevant labels."""
-        labels = [
-            f"{chr(x)}{y}" for x in range(ord("A"), ord("D") + 1) for y in range(6)
-        ]
-        labels += [f"{x}{y}" for x in range(1, 4) for y in range(8)]
-        for label in labels:
-            await self.device.send_command(f"ZQS1{label}")
+        await self.device.send_command(list(_LABEL_QUERIES))
 
     async def set_labels(self):
         """Set Labels."""
@@ -380,10 +493,10 @@ class LumagenApp(LoggingMixin):
         async def shutdown():
             if self.device is not None:
                 await self.device.close()
-            update_text_area(self.output_field, "Waiting ")
-            for _ in range(args.exit_wait_timer):
-                update_text_area(self.output_field, ".")
-                await asyncio.sleep(1)
+            update_text_area(
+                self.output_field, "Waiting " + "." * args.exit_wait_timer
+            )
+            await asyncio.sleep(args.exit_wait_timer)
             event.app.exit()
 
         asyncio.create_task(shutdown())  # noqa: RUF006
@@ -441,7 +554,12 @@ def main():
     parsed_args = parser.parse_args()
 
     app = LumagenApp()
-    asyncio.run(app.run(args=parsed_args))
+    try:
+        import uvloop  # noqa: PLC0415
+    except ImportError:
+        asyncio.run(app.run(args=parsed_args))
+    else:
+        uvloop.run(app.run(args=parsed_args))
 
 
 if __name__ == "__main__":
@@ -4,7 +4,7 @@ import asyncio
 import contextlib
 import logging
 
-from lumagen.constants import DeviceStatus
+from lumagen.constants import DeviceStatus, Frame3DTypeEnum, InputStatus
 from lumagen.utils import (
     BufferManager,
     LoggingMixin,
@@ -30,6 +30,14 @@ def test_buffer_manager_append_extract(buffer_manager: BufferManager) -> None:
     assert buffer_manager.is_empty()
 
 
+def test_buffer_manager_append_bytes(buffer_manager: BufferManager) -> None:
+    """Test appending raw bytes alongside strings in BufferManager."""
+    buffer_manager.append(b"!S02,")
+    buffer_manager.append("1\n")
+    assert buffer_manager.extract_message() == "!S02,1"
+    assert buffer_manager.is_empty()
+
+
 def test_buffer_manager_multiple_messages(buffer_manager: BufferManager) -> None:
     """Test handling multiple messages in BufferManager."""
     buffer_manager.append("Message 1\nMessage 2\n")
@@ -49,6 +57,8 @@ def test_buffer_manager_starts_with(buffer_manager: BufferManager) -> None:
     """Test starts_with method in BufferManager."""
     buffer_manager.append("ERROR: Something went wrong")
     assert buffer_manager.starts_with(("ERROR", "WARN"))
+    assert buffer_manager.starts_with(("error", "warn"))  # Cached, case-insensitive
+    assert not buffer_manager.starts_with(("WARN",))
 
 
 def test_buffer_manager_ends_with_terminator(buffer_manager: BufferManager) -> None:
@@ -101,6 +111,12 @@ def test_buffer_adjust_buffer() -> None:
     buffer_manager.adjust_buffer(["keyword"])
     assert buffer_manager.buffer == "KEYword middle"
 
+    # Test: Keyword priority wins over position
+    buffer_manager.clear()
+    buffer_manager.append("#ZY junk !I21,data")
+    buffer_manager.adjust_buffer(["power", "!", "#"])
+    assert buffer_manager.buffer == "!I21,data"
+
 
 def test_process_command_or_keypress() -> None:
     """Test processing command or keypress."""
@@ -118,6 +134,20 @@ def test_process_command_or_keypress() -> None:
     assert process_command_or_keypress("unknown", my_dict) == (None, None, False)
 
 
+def test_process_command_or_keypress_key_lengths() -> None:
+    """Test that the key-length lookup matches the longest key first."""
+    my_dict = {"<": "Left", "<CR>": "OK", "X": "Exit"}
+    lengths = (4, 1)
+    assert process_command_or_keypress("#<CR>{", my_dict, lengths) == (
+        "<CR>",
+        "OK",
+        False,
+    )
+    assert process_command_or_keypress("<{", my_dict, lengths) == ("<", "Left", True)
+    assert process_command_or_keypress("#X{", my_dict, lengths) == ("X", "Exit", False)
+    assert process_command_or_keypress("#?{", my_dict, lengths) == (None, None, False)
+
+
 def test_flatten_dictionary() -> None:
     """Test flattening nested dictionaries."""
     nested_dict = {"a": 1, "b": {"c": 2, "d": {"e": 3}}}
@@ -132,6 +162,34 @@ def test_flatten_dictionary() -> None:
     assert flatten_dictionary(nested_enum_dict) == expected_output
 
 
+def test_flatten_dictionary_equal_valued_enums() -> None:
+    """Test that IntEnum members with equal values keep their own strings."""
+    assert Frame3DTypeEnum.OFF == InputStatus.NONE
+
+    for _ in range(2):  # Second pass is served from the enum string cache
+        assert flatten_dictionary({"status": InputStatus.NONE}) == {
+            "status": str(InputStatus.NONE)
+        }
+        assert flatten_dictionary({"input_3d_type": Frame3DTypeEnum.OFF}) == {
+            "input_3d_type": str(Frame3DTypeEnum.OFF)
+        }
+    assert str(InputStatus.NONE) != str(Frame3DTypeEnum.OFF)
+
+
+def test_flatten_dictionary_precedence() -> None:
+    """Test that the first non-None value in depth-first order wins."""
+    nested_dict = {
+        "a": {"x": None, "y": {"x": 1}},
+        "b": {"x": 2, "z": 3},
+        "x": 4,
+    }
+    assert flatten_dictionary(nested_dict) == {"x": 1, "z": 3}
+
+    merged = {"z": 0, "x": None}
+    assert flatten_dictionary(nested_dict, merged) is merged
+    assert merged == {"z": 0, "x": 1}
+
+
 @pytest.fixture
 def task_manager() -> TaskManager:
     """Fixture for TaskManager instance."""
@@ -449,6 +507,7 @@ def test_logging_mixin(caplog: pytest.LogCaptureFixture) -> None:
     assert hasattr(test_logger, "log")
     assert test_logger.log is not None
     assert isinstance(test_logger.log, LogProxy)
+    assert test_logger.log is test_logger.log  # Created once per instance
 
     # Ensure invalid attribute access raises AttributeError
     with pytest.raises(
@@ -504,7 +563,7 @@ def test_custom_log_pprint(caplog: pytest.LogCaptureFixture) -> None:
     data = {"key1": "value1", "key2": {"subkey": "subvalue"}}
 
     with caplog.at_level(logging.INFO):
-        custom_log_pprint(data, logging.getLogger().info)
+        custom_log_pprint(data, logging.getLogger(), logging.INFO)
 
     assert "key1" in caplog.text
     assert "subkey" in caplog.text
@@ -516,7 +575,7 @@ def test_custom_log_pprint(caplog: pytest.LogCaptureFixture) -> None:
     ]
 
     with caplog.at_level(logging.INFO):
-        custom_log_pprint(list_data, logging.getLogger().info)
+        custom_log_pprint(list_data, logging.getLogger(), logging.INFO)
 
     assert "item1" in caplog.text
     assert "nested_dict" in caplog.text
@@ -532,10 +591,33 @@ def test_custom_log_pprint(caplog: pytest.LogCaptureFixture) -> None:
     }
 
     with caplog.at_level(logging.INFO):
-        custom_log_pprint(mixed_data, logging.getLogger().info)
+        custom_log_pprint(mixed_data, logging.getLogger(), logging.INFO)
 
     assert "42" in caplog.text  # Checking int
     assert "3.14159" in caplog.text  # Checking float
     assert "True" in caplog.text  # Checking boolean True
     assert "False" in caplog.text  # Checking boolean False
     assert "None" in caplog.text  # Checking None
+
+
+def test_custom_log_pprint_skips_disabled_level(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test that custom_log_pprint does nothing when the level is disabled."""
+
+    class TestLogger(LoggingMixin):
+        """Test class inheriting from LoggingMixin."""
+
+    test_logger = TestLogger()
+    data = {"key1": "value1"}
+
+    with caplog.at_level(logging.INFO):
+        custom_log_pprint(data, test_logger.log)
+        custom_log_pprint(data, logging.getLogger(), logging.DEBUG)
+
+    assert "key1" not in caplog.text
+
+    with caplog.at_level(logging.DEBUG):
+        custom_log_pprint(data, test_logger.log)
+
+    assert "key1" in caplog.text
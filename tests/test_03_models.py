@@ -1,5 +1,7 @@
 """Tests for the `lumagen.models` module."""
 
+import json
+from types import MappingProxyType
 from unittest.mock import MagicMock
 
 from lumagen.constants import DeviceStatus, StateStatus
@@ -14,6 +16,10 @@ from lumagen.models import (
     DeviceInfo,
     Frame3DTypeEnum,
     InputStatus,
+    _map_nls_active,
+    _map_output_mode,
+    _map_source_dynamic_range,
+    _map_source_mode,
 )
 from pydantic import ValidationError
 import pytest
@@ -124,15 +130,6 @@ def test_base_input_video_interlaced(input_interlaced, expected_interlaced) -> N
         == expected_interlaced
     )
 
-    with pytest.raises(ValidationError, match="Invalid type for vertical_rate: list"):
-        BaseInputVideo(input_vertical_rate=[6000])
-
-    with pytest.raises(ValidationError, match="Invalid type for vertical_rate: dict"):
-        BaseInputVideo(input_vertical_rate={"rate": 6000})  # Passing a dict
-
-    with pytest.raises(TypeError, match="Invalid type for vertical_rate: bool"):
-        BaseInputVideo(input_vertical_rate=True)  # Passing a boolean
-
 
 @pytest.mark.parametrize(
     ("input_3d_type", "expected_value"),
@@ -182,106 +179,110 @@ def test_base_input_video_status_valid(input_video_status, expected_value) -> No
 
 
 @pytest.mark.parametrize(
-    ("input_vertical_rate", "expected"),
+    ("invalid_input", "expected_exception", "error_match"),
     [
-        (None, None),  # None should remain None
+        # Non-numeric string
+        ("invalid", ValidationError, "Invalid input_vertical_rate string"),
+        # Strings int() accepts but the device never sends
+        (" 6000", ValidationError, "Invalid input_vertical_rate string"),
+        ("-6000", ValidationError, "Invalid input_vertical_rate string"),
+        ("60_00", ValidationError, "Invalid input_vertical_rate string"),
+        ({}, ValidationError, "Invalid type for vertical_rate: dict"),
+        ({"rate": 6000}, ValidationError, "Invalid type for vertical_rate: dict"),
+        ([], ValidationError, "Invalid type for vertical_rate: list"),
+        ([6000], ValidationError, "Invalid type for vertical_rate: list"),
+        # Booleans are rejected before pydantic wraps the error
+        (True, TypeError, "Invalid type for vertical_rate: bool"),
+        (False, TypeError, "Invalid type for vertical_rate: bool"),
     ],
 )
-def test_base_input_video_none(input_vertical_rate, expected) -> None:
-    """Test None values in BaseInputVideo."""
-    video_info = BaseInputVideo(input_vertical_rate=input_vertical_rate)
-    assert video_info.input_vertical_rate == expected
+def test_base_input_video_vertical_rate_errors(
+    invalid_input, expected_exception, error_match
+) -> None:
+    """Test invalid input_vertical_rate values in BaseInputVideo."""
+    with pytest.raises(expected_exception, match=error_match):
+        BaseInputVideo(input_vertical_rate=invalid_input)
 
 
-@pytest.mark.parametrize(
-    "invalid_input",
-    [
-        "invalid",  # Non-numeric string should fail
-        {},  # Dictionary should fail
-        [],  # List should fail
-    ],
+FULL_INFO_DATA = MappingProxyType(
+    {
+        "field.0": 1,
+        "field.1": "059",
+        "field.2": 1080,
+        "field.3": 2,
+        "field.4": 5,
+        "field.5": 16,
+        "field.6": 9,
+        "field.7": "N",
+        "field.8": 2,
+        "field.9": "F",
+        "field.10": 3,
+        "field.11": 3,
+        "field.12": "059",
+        "field.13": 2160,
+        "field.14": 16,
+        "field.15": "1",
+        "field.16": "0",
+        "field.17": "p",
+        "field.18": "P",
+        "field.19": 8,
+        "field.20": 3,
+        "field.21": 4,
+        "field.22": 9,
+    }
 )
-def test_base_input_video_invalid(invalid_input) -> None:
-    """Test invalid values in BaseInputVideo."""
-    with pytest.raises(ValidationError):
-        BaseInputVideo(input_vertical_rate=invalid_input)
 
+FULL_INFO_EXPECTED = MappingProxyType(
+    {
+        "input_status": 1,
+        "source_vertical_rate": 59.94,  # Transformed
+        "source_vertical_resolution": 1080,
+        "source_3d_mode": 2,
+        "active_input_config_number": 5,
+        "source_raster_aspect": 16,
+        "current_source_content_aspect": 9,
+        "nls_active": "NLS",  # Transformed
+        "output_3d_mode": 2,
+        "output_on": {
+            "video_out1": "On",
+            "video_out2": "On",
+            "video_out3": "On",
+            "video_out4": "On",
+        },  # Hex "F" -> all On
+        "active_output_cms": 3,
+        "active_output_style": 3,
+        "output_vertical_rate": 59.94,  # Transformed
+        "output_vertical_resolution": 2160,
+        "output_aspect": 16,
+        "output_colorspace": 709,  # Transformed
+        "source_dynamic_range": "SDR",  # Transformed
+        "source_mode": "Progressive",  # Transformed
+        "output_mode": "Progressive",  # Transformed
+        "virtual_input_selected": 8,
+        "physical_input_selected": 3,
+        "detected_source_raster_aspect": 4,
+        "detected_source_aspect": 9,
+    }
+)
 
-@pytest.mark.parametrize("invalid_boolean", [True, False])
-def test_base_input_video_invalid_boolean(invalid_boolean) -> None:
-    """Test invalid boolean values in BaseInputVideo."""
-    with pytest.raises(TypeError, match="Invalid type for vertical_rate: bool"):
-        BaseInputVideo(input_vertical_rate=invalid_boolean)
 
+FULL_INFO_JSON = json.dumps(dict(FULL_INFO_DATA)).encode()
 
-@pytest.mark.parametrize(
-    ("valid_data", "expected_values"),
-    [
-        (
-            {
-                "field.0": 1,
-                "field.1": "059",
-                "field.2": 1080,
-                "field.3": 2,
-                "field.4": 5,
-                "field.5": 16,
-                "field.6": 9,
-                "field.7": "N",
-                "field.8": 2,
-                "field.9": "F",
-                "field.10": 3,
-                "field.11": 3,
-                "field.12": "059",
-                "field.13": 2160,
-                "field.14": 16,
-                "field.15": "1",
-                "field.16": "0",
-                "field.17": "p",
-                "field.18": "P",
-                "field.19": 8,
-                "field.20": 3,
-                "field.21": 4,
-                "field.22": 9,
-            },
-            {
-                "input_status": 1,
-                "source_vertical_rate": 59.94,  # Transformed
-                "source_vertical_resolution": 1080,
-                "source_3d_mode": 2,
-                "active_input_config_number": 5,
-                "source_raster_aspect": 16,
-                "current_source_content_aspect": 9,
-                "nls_active": "NLS",  # Transformed
-                "output_3d_mode": 2,
-                "output_on": {
-                    "video_out1": "On",
-                    "video_out2": "On",
-                    "video_out3": "On",
-                    "video_out4": "On",
-                },  # Hex "F" -> all On
-                "active_output_cms": 3,
-                "active_output_style": 3,
-                "output_vertical_rate": 59.94,  # Transformed
-                "output_vertical_resolution": 2160,
-                "output_aspect": 16,
-                "output_colorspace": 709,  # Transformed
-                "source_dynamic_range": "SDR",  # Transformed
-                "source_mode": "Progressive",  # Transformed
-                "output_mode": "Progressive",  # Transformed
-                "virtual_input_selected": 8,
-                "physical_input_selected": 3,
-                "detected_source_raster_aspect": 4,
-                "detected_source_aspect": 9,
-            },
-        )
-    ],
-)
-def test_base_full_info_valid(valid_data, expected_values) -> None:
+
+@pytest.fixture(scope="session")
+def full_info() -> BaseFullInfo:
+    """Fixture for a BaseFullInfo validated once from FULL_INFO_JSON."""
+    return BaseFullInfo.model_validate_json(FULL_INFO_JSON)
+
+
+def test_base_full_info_valid(full_info: BaseFullInfo) -> None:
     """Test BaseFullInfo with valid data."""
-    response = BaseFullInfo(**valid_data)
+    assert full_info.model_dump(include=set(FULL_INFO_EXPECTED)) == FULL_INFO_EXPECTED
 
-    for field, expected_value in expected_values.items():
-        assert getattr(response, field) == expected_value, f"Mismatch in {field}"
+
+def test_base_full_info_json_matches_kwargs(full_info: BaseFullInfo) -> None:
+    """Test the JSON and keyword construction paths produce the same model."""
+    assert BaseFullInfo(**FULL_INFO_DATA) == full_info
 
 
 @pytest.mark.parametrize(
@@ -298,19 +299,6 @@ def test_validate_output_on_valid_dict(input_value, expected_output) -> None:
     assert BaseFullInfo.validate_output_on(input_value) == expected_output
 
 
-@pytest.mark.parametrize(
-    ("input_value", "expected_output"),
-    [
-        ("X", None),  # Invalid value not in lookup map
-        ("", None),  # Empty string should return None
-        (None, None),  # None input should return None
-    ],
-)
-def test_validate_nls_active_returns_none(input_value, expected_output) -> None:
-    """Test validate_nls_active returns None for values not in the lookup map."""
-    assert BaseFullInfo.validate_nls_active(input_value) == expected_output
-
-
 @pytest.mark.parametrize(
     ("input_value", "expected_output"),
     [
@@ -326,44 +314,26 @@ def test_validate_output_colorspace_int_input(input_value, expected_output) -> N
 
 
 @pytest.mark.parametrize(
-    ("input_value", "expected_output"),
+    "input_value",
     [
-        ("X", None),  # Invalid value not in lookup map
-        ("", None),  # Empty string should return None
-        (None, None),  # None input should return None
+        "X",  # Invalid value not in lookup map
+        "",  # Empty string should return None
+        None,  # None input should return None
     ],
 )
-def test_validate_source_dynamic_range_returns_none(
-    input_value, expected_output
-) -> None:
-    """Test validate_source_dynamic_range returns None for values not in the lookup map."""
-    assert BaseFullInfo.validate_source_dynamic_range(input_value) == expected_output
-
-
 @pytest.mark.parametrize(
-    ("input_value", "expected_output"),
+    "validator",
     [
-        ("X", None),  # Invalid value not in lookup map
-        ("", None),  # Empty string should return None
-        (None, None),  # None input should return None
+        _map_nls_active,
+        _map_source_dynamic_range,
+        _map_source_mode,
+        _map_output_mode,
     ],
+    ids=lambda validator: validator.__name__,
 )
-def test_validate_source_mode_returns_none(input_value, expected_output) -> None:
-    """Test validate_source_mode returns None for values not in the lookup map."""
-    assert BaseFullInfo.validate_source_mode(input_value) == expected_output
-
-
-@pytest.mark.parametrize(
-    ("input_value", "expected_output"),
-    [
-        ("X", None),  # Invalid value not in lookup map
-        ("", None),  # Empty string should return None
-        (None, None),  # None input should return None
-    ],
-)
-def test_validate_output_mode_returns_none(input_value, expected_output) -> None:
-    """Test validate_output_mode returns None for values not in the lookup map."""
-    assert BaseFullInfo.validate_output_mode(input_value) == expected_output
+def test_lookup_validators_return_none(validator, input_value) -> None:
+    """Test the lookup-map validators return None for values not in their map."""
+    assert validator(input_value) is None
 
 
 @pytest.mark.parametrize(
@@ -520,11 +490,10 @@ def test_base_output_basic_info(input_data, expected_output) -> None:
     """Test BaseOutputBasicInfo with valid transformations and None values."""
     output_info = BaseOutputBasicInfo(**input_data)
 
-    for key, expected_value in expected_output.items():
-        actual_value = getattr(output_info, key)
-        assert (
-            actual_value == expected_value
-        ), f"Expected {key} to be {expected_value}, but got {actual_value}"
+    assert (
+        output_info.model_dump(exclude_raw_fields=False, include=set(expected_output))
+        == expected_output
+    )
 
 
 @pytest.mark.parametrize(
@@ -542,9 +511,12 @@ def test_base_output_basic_info_invalid(invalid_data) -> None:
         BaseOutputBasicInfo(**invalid_data)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def base_output_instance():
-    """Fixture to create a BaseOutputBasicInfo instance with test data."""
+    """Fixture to create a BaseOutputBasicInfo instance with test data.
+
+    Module-scoped: the tests only call `model_dump`, which does not mutate it.
+    """
     return BaseOutputBasicInfo(
         field_1="raw1",
         field_2="raw2",
@@ -617,6 +589,8 @@ def test_base_output_mode_valid(
     "invalid_data",
     [
         {"output_vertical_rate": "invalid"},  # Non-numeric string
+        {"output_vertical_rate": "-6000"},  # Signed string
+        {"output_vertical_rate": "60_00"},  # Underscore separator
         {"output_vertical_rate": ["invalid"]},  # List instead of number
         {"output_vertical_rate": {"rate": 60}},  # Dictionary instead of number
     ],
@@ -658,13 +632,9 @@ def test_base_output_mode_invalid(invalid_data) -> None:
 )
 def test_device_info_valid(input_data, expected_data) -> None:
     """Test valid DeviceInfo instances."""
-    device = DeviceInfo(**input_data)
+    dumped = DeviceInfo(**input_data).model_dump()
 
-    for key, expected_value in expected_data.items():
-        actual_value = getattr(device, key)
-        assert (
-            actual_value == expected_value
-        ), f"Expected {key} to be {expected_value}, but got {actual_value}"
+    assert {key: dumped[key] for key in expected_data} == expected_data
 
 
 @pytest.mark.parametrize(
@@ -679,3 +649,24 @@ def test_device_info_invalid(invalid_data) -> None:
     """Test DeviceInfo with invalid values (should raise ValidationError)."""
     with pytest.raises(ValidationError):
         DeviceInfo(**invalid_data)
+
+
+def test_device_info_model_api() -> None:
+    """Test that DeviceInfo keeps the BaseModel dump and copy surface."""
+    info = DeviceInfo(model_name="Radiance", serial_number=12345)
+
+    assert info.model_dump(exclude_none=True) == {
+        "model_name": "Radiance",
+        "serial_number": 12345,
+    }
+    assert info.model_dump(include={"model_name"}) == {"model_name": "Radiance"}
+    assert json.loads(info.model_dump_json(exclude_none=True)) == {
+        "model_name": "Radiance",
+        "serial_number": 12345,
+    }
+    assert DeviceInfo.model_fields["serial_number"].title == "Serial Number"
+
+    copied = info.model_copy(update={"model_name": "RadiancePro"})
+    assert copied.model_name == "RadiancePro"
+    assert copied.serial_number == 12345
+    assert info.model_name == "Radiance"
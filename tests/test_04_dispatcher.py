@@ -1,5 +1,6 @@
 """Tests for the `lumagen.dispatcher` module."""
 
+from collections.abc import Callable, Iterator
 from unittest.mock import AsyncMock, Mock
 
 from lumagen.constants import EventType
@@ -7,10 +8,31 @@ from lumagen.dispatcher import Dispatcher
 import pytest
 
 
+def _recording_callback(calls: list) -> Callable:
+    """Return a sync listener that appends its arguments to `calls`."""
+
+    def callback(event_type, event_data) -> None:
+        calls.append((event_type, event_data))
+
+    return callback
+
+
+@pytest.fixture(scope="module")
+def shared_dispatcher() -> Dispatcher:
+    """Fixture for one Dispatcher instance shared by the module."""
+    return Dispatcher()
+
+
+@pytest.fixture
+def dispatcher(shared_dispatcher: Dispatcher) -> Iterator[Dispatcher]:
+    """Fixture for the shared Dispatcher, cleared of listeners after each test."""
+    yield shared_dispatcher
+    shared_dispatcher.clear_listeners()
+
+
 @pytest.mark.asyncio
-async def test_register_listener_and_invoke_event() -> None:
+async def test_register_listener_and_invoke_event(dispatcher: Dispatcher) -> None:
     """Test that a listener is registered and invoked correctly."""
-    dispatcher = Dispatcher()
     mock_callback = Mock()
 
     dispatcher.register_listener(EventType.CONNECTION_STATE, mock_callback)
@@ -22,9 +44,8 @@ async def test_register_listener_and_invoke_event() -> None:
 
 
 @pytest.mark.asyncio
-async def test_register_async_listener_and_invoke() -> None:
+async def test_register_async_listener_and_invoke(dispatcher: Dispatcher) -> None:
     """Test that an async listener is registered and invoked correctly."""
-    dispatcher = Dispatcher()
     mock_callback = AsyncMock()
 
     dispatcher.register_listener(EventType.DATA_RECEIVED, mock_callback)
@@ -34,48 +55,44 @@ async def test_register_async_listener_and_invoke() -> None:
 
 
 @pytest.mark.asyncio
-async def test_remove_listener() -> None:
+async def test_remove_listener(dispatcher: Dispatcher) -> None:
     """Test that a listener is removed properly."""
-    dispatcher = Dispatcher()
-    mock_callback = Mock()
+    calls = []
+    callback = _recording_callback(calls)
 
-    dispatcher.register_listener(EventType.DATA_RECEIVED, mock_callback)
-    dispatcher.remove_listener(EventType.DATA_RECEIVED, mock_callback)
+    dispatcher.register_listener(EventType.DATA_RECEIVED, callback)
+    dispatcher.remove_listener(EventType.DATA_RECEIVED, callback)
 
     await dispatcher.invoke_event(EventType.DATA_RECEIVED, message="error")
-    mock_callback.assert_not_called()
+    assert calls == []
 
 
 @pytest.mark.asyncio
-async def test_clear_listeners() -> None:
+async def test_clear_listeners(dispatcher: Dispatcher) -> None:
     """Test that all listeners are cleared correctly."""
-    dispatcher = Dispatcher()
-    mock_callback_1 = Mock()
-    mock_callback_2 = Mock()
+    calls = []
 
-    dispatcher.register_listener(EventType.DATA_RECEIVED, mock_callback_1)
-    dispatcher.register_listener(EventType.DATA_RECEIVED, mock_callback_2)
+    dispatcher.register_listener(EventType.DATA_RECEIVED, _recording_callback(calls))
+    dispatcher.register_listener(EventType.DATA_RECEIVED, _recording_callback(calls))
 
     dispatcher.clear_listeners(EventType.DATA_RECEIVED)
     await dispatcher.invoke_event(EventType.DATA_RECEIVED, data="test")
 
-    mock_callback_1.assert_not_called()
-    mock_callback_2.assert_not_called()
+    assert calls == []
 
 
 @pytest.mark.asyncio
-async def test_clear_all_listeners() -> None:
+async def test_clear_all_listeners(dispatcher: Dispatcher) -> None:
     """Test that all event listeners are cleared correctly."""
-    dispatcher = Dispatcher()
-    mock_callback_1 = Mock()
-    mock_callback_2 = Mock()
+    calls = []
 
-    dispatcher.register_listener(EventType.CONNECTION_STATE, mock_callback_1)
-    dispatcher.register_listener(EventType.DATA_RECEIVED, mock_callback_2)
+    dispatcher.register_listener(
+        EventType.CONNECTION_STATE, _recording_callback(calls)
+    )
+    dispatcher.register_listener(EventType.DATA_RECEIVED, _recording_callback(calls))
 
     dispatcher.clear_listeners()  # Remove all listeners
     await dispatcher.invoke_event(EventType.CONNECTION_STATE, state="connected")
     await dispatcher.invoke_event(EventType.DATA_RECEIVED, data="test")
 
-    mock_callback_1.assert_not_called()
-    mock_callback_2.assert_not_called()
+    assert calls == []
@@ -22,21 +22,43 @@ from lumagen.messages import (
 )
 import pytest
 
+# Raw device messages, interpolated once at import.
+MSG_STATUS_ALIVE = f"!{constants.STATUS_ALIVE},Ok"
+MSG_STATUS_ID = f"!{constants.STATUS_ID},RadiancePro,101524,1018,001351"
+MSG_POWER_STATE = f"!{constants.STATUS_POWER},On"
+MSG_INPUT_BASIC_INFO = f"!{constants.INPUT_BASIC_INFO},2,A,5"
+MSG_INPUT_VIDEO = f"!{constants.INPUT_VIDEO},1,6000,1920,1080,1,2"
+MSG_FULL_V1 = f"!{constants.DEVICE_FULL_V1},1,059,1080,2,5,16,9,N,2,0,3,3,060,2160,16"
+MSG_FULL_V2 = f"!{constants.DEVICE_FULL_V2},1,059,1080,2,5,16,9,N,2,0,3,3,060,2160,16,1,0,p,P,8,3,4,9"
+MSG_FULL_V3 = f"!{constants.DEVICE_FULL_V3},1,059,1080,2,5,16,9,N,2,2,3,3,060,2160,16,1,0,p,P,8,3"
+MSG_FULL_V4 = f"!{constants.DEVICE_FULL_V4},0,060,1080,4,4,178,240,-,4,1,4,4,059,2160,178,2,1,i,P,1,2,240,178"
+MSG_AUTO_ASPECT = f"!{constants.DEVICE_AUTOASPECT_QUERY},0"
+MSG_GAME_MODE = f"!{constants.DEVICE_GAMEMODE_QUERY},1"
+MSG_OUTPUT_BASIC_INFO = f"!{constants.DEVICE_BASIC_OUTPUT_INFO},5,3,0,3,0"
+MSG_OUTPUT_MODE = f"!{constants.DEVICE_OUTPUT_MODE},5994,1920,1080,0,0"
+MSG_OUTPUT_COLOR_FORMAT = f"!{constants.DEVICE_OUTPUT_COLOR_FORMAT},2"
+
+
+@pytest.fixture(scope="session")
+def parsed(request: pytest.FixtureRequest) -> MessageParser:
+    """Parse the indirectly parametrized message once per session."""
+    return MessageParser(request.param)
+
 
 @pytest.mark.parametrize(
-    ("message", "expected_name", "expected_fields"),
+    ("parsed", "expected_name", "expected_fields"),
     [
         ("POWER OFF.", "S02", ["0"]),
         ("Power-up complete.", "S02", ["1"]),
         ("#UNKNOWN", "", []),
         ("#ZQS1A9!S1A,Input", constants.DEVICE_LABEL_QUERY, ["A9", "Input"]),
     ],
+    indirect=["parsed"],
 )
-def test_message_parser(message, expected_name, expected_fields) -> None:
+def test_message_parser(parsed, expected_name, expected_fields) -> None:
     """Test parsing messages with MessageParser."""
-    parser = MessageParser(message)
-    assert parser.name == expected_name
-    assert parser.fields == expected_fields
+    assert parsed.name == expected_name
+    assert parsed.fields == expected_fields
 
 
 def test_message_parser_to_dict() -> None:
@@ -56,12 +78,25 @@ def test_message_parser_str_repr() -> None:
 
 def test_response_factory_with_registered_class() -> None:
     """Test Response factory method with registered class."""
-    message = f"!{constants.STATUS_ALIVE},Ok"
+    message = MSG_STATUS_ALIVE
     response = Response.factory(message)
     assert isinstance(response, StatusAlive)
     assert response.field_is_alive is True
 
 
+def test_response_factory_builds_independent_model_responses() -> None:
+    """Test that repeated model payloads never share a mutable instance."""
+    message = "!I00,1,A,2"
+    first = Response.factory(message)
+    second = Response.factory(message)
+    assert isinstance(first, InputBasicInfo)
+    assert second == first
+    assert second is not first
+
+    first.input_memory = "B"
+    assert second.input_memory == "A"
+
+
 def test_response_factory_with_unregistered_class() -> None:
     """Test Response factory method with unregistered class."""
     message = "!UNKNOWN,DATA"
@@ -72,14 +107,14 @@ def test_response_factory_with_unregistered_class() -> None:
 
 def test_status_alive() -> None:
     """Test parsing StatusAlive response."""
-    message = f"!{constants.STATUS_ALIVE},Ok"
+    message = MSG_STATUS_ALIVE
     response = StatusAlive(MessageParser(message))
     assert response.field_is_alive is True
 
 
 def test_status_id() -> None:
     """Test parsing StatusID response."""
-    message = f"!{constants.STATUS_ID},RadiancePro,101524,1018,001351"
+    message = MSG_STATUS_ID
     response = StatusID(MessageParser(message))
     assert response.name == constants.STATUS_ID
     assert response.model_name == "RadiancePro"
@@ -90,7 +125,7 @@ def test_status_id() -> None:
 
 def test_power_state() -> None:
     """Test parsing PowerState response."""
-    message = f"!{constants.STATUS_POWER},On"
+    message = MSG_POWER_STATE
     response = PowerState(MessageParser(message))
     assert response.name == constants.STATUS_POWER
     assert response.field_device_status == "On"
@@ -98,7 +133,7 @@ def test_power_state() -> None:
 
 def test_input_basic_info() -> None:
     """Test parsing InputBasicInfo response."""
-    message = f"!{constants.INPUT_BASIC_INFO},2,A,5"
+    message = MSG_INPUT_BASIC_INFO
     response = InputBasicInfo(MessageParser(message))
 
     assert response.name == constants.INPUT_BASIC_INFO
@@ -109,7 +144,7 @@ def test_input_basic_info() -> None:
 
 def test_input_video() -> None:
     """Test parsing InputVideo response."""
-    message = f"!{constants.INPUT_VIDEO},1,6000,1920,1080,1,2"
+    message = MSG_INPUT_VIDEO
     response = InputVideo(MessageParser(message))
 
     assert response.name == constants.INPUT_VIDEO
@@ -121,197 +156,163 @@ def test_input_video() -> None:
     assert response.input_3d_type == 2
 
 
-def test_full_info_v1() -> None:
-    """Test parsing FullInfoV1 response."""
-    message = f"!{constants.DEVICE_FULL_V1},1,059,1080,2,5,16,9,N,2,0,3,3,060,2160,16"
-    response = FullInfoV1(MessageParser(message))
-
-    assert response.name == constants.DEVICE_FULL_V1
-    assert response.input_status == 1
-    assert response.source_vertical_rate == 59.94
-    assert response.source_vertical_resolution == 1080
-    assert response.source_3d_mode == 2
-    assert response.active_input_config_number == 5
-    assert response.source_raster_aspect == 16
-    assert response.current_source_content_aspect == 9
-    assert response.nls_active == "NLS"
-    assert response.output_3d_mode == 2
-    assert response.output_on == {
-        "video_out1": "Off",
-        "video_out2": "Off",
-        "video_out3": "Off",
-        "video_out4": "Off",
-    }
-    assert response.active_output_cms == 3
-    assert response.active_output_style == 3
-    assert response.output_vertical_rate == 60.0
-    assert response.output_vertical_resolution == 2160
-    assert response.output_aspect == 16
-
-
-def test_full_info_v2() -> None:
-    """Test parsing FullInfoV2 response."""
-    message = f"!{constants.DEVICE_FULL_V2},1,059,1080,2,5,16,9,N,2,0,3,3,060,2160,16,1,0,p,P,8,3,4,9"
-    response = FullInfoV2(MessageParser(message))
-
-    assert response.name == constants.DEVICE_FULL_V2
-    assert response.input_status == 1
-    assert response.source_vertical_rate == 59.94
-    assert response.source_vertical_resolution == 1080
-    assert response.source_3d_mode == 2
-    assert response.active_input_config_number == 5
-    assert response.source_raster_aspect == 16
-    assert response.current_source_content_aspect == 9
-    assert response.nls_active == "NLS"
-    assert response.output_3d_mode == 2
-    assert response.output_on == {
-        "video_out1": "Off",
-        "video_out2": "Off",
-        "video_out3": "Off",
-        "video_out4": "Off",
-    }
-    assert response.active_output_cms == 3
-    assert response.active_output_style == 3
-    assert response.output_vertical_rate == 60.0
-    assert response.output_vertical_resolution == 2160
-    assert response.output_aspect == 16
-    assert response.output_colorspace == 709
-    assert response.source_dynamic_range == "SDR"
-    assert response.source_mode == "Progressive"
-    assert response.output_mode == "Progressive"
-    assert response.virtual_input_selected == 8
-    assert response.physical_input_selected == 3
-    assert response.detected_source_raster_aspect == 4
-    assert response.detected_source_aspect == 9
-
-
-def test_full_info_v3() -> None:
-    """Test parsing FullInfoV3 response."""
-    message = f"!{constants.DEVICE_FULL_V3},1,059,1080,2,5,16,9,N,2,2,3,3,060,2160,16,1,0,p,P,8,3"
-    response = FullInfoV3(MessageParser(message))
-
-    assert response.name == constants.DEVICE_FULL_V3
-    assert response.input_status == 1
-    assert response.source_vertical_rate == 59.94
-    assert response.source_vertical_resolution == 1080
-    assert response.source_3d_mode == 2
-    assert response.active_input_config_number == 5
-    assert response.source_raster_aspect == 16
-    assert response.current_source_content_aspect == 9
-    assert response.nls_active == "NLS"
-    assert response.output_3d_mode == 2
-    assert response.output_on == {
-        "video_out1": "Off",
-        "video_out2": "On",
-        "video_out3": "Off",
-        "video_out4": "Off",
-    }
-    assert response.active_output_cms == 3
-    assert response.active_output_style == 3
-    assert response.output_vertical_rate == 60.0
-    assert response.output_vertical_resolution == 2160
-    assert response.output_aspect == 16
-    assert response.output_colorspace == 709
-    assert response.source_dynamic_range == "SDR"
-    assert response.source_mode == "Progressive"
-    assert response.output_mode == "Progressive"
-    assert response.virtual_input_selected == 8
-    assert response.physical_input_selected == 3
-
-
-def test_full_info_v4() -> None:
-    """Test parsing FullInfoV4 response."""
-    message = f"!{constants.DEVICE_FULL_V4},0,060,1080,4,4,178,240,-,4,1,4,4,059,2160,178,2,1,i,P,1,2,240,178"
-    response = FullInfoV4(MessageParser(message))
-
-    assert response.name == constants.DEVICE_FULL_V4
-    assert response.input_status == 0
-    assert response.source_vertical_rate == 60.0
-    assert response.source_vertical_resolution == 1080
-    assert response.source_3d_mode == 4
-    assert response.active_input_config_number == 4
-    assert response.source_raster_aspect == 178
-    assert response.current_source_content_aspect == 240
-    assert response.nls_active == "Normal"
-    assert response.output_3d_mode == 4
-    assert response.output_on == {
-        "video_out1": "On",
-        "video_out2": "Off",
-        "video_out3": "Off",
-        "video_out4": "Off",
-    }
-    assert response.active_output_cms == 4
-    assert response.active_output_style == 4
-    assert response.output_vertical_rate == 59.94
-    assert response.output_vertical_resolution == 2160
-    assert response.output_aspect == 178
-    assert response.output_colorspace == 2020
-    assert response.source_dynamic_range == "HDR"
-    assert response.source_mode == "Interlaced"
-    assert response.output_mode == "Progressive"
-    assert response.virtual_input_selected == 1
-    assert response.physical_input_selected == 2
-    assert response.detected_source_raster_aspect == 240
-    assert response.detected_source_aspect == 178
-
-
-def test_auto_aspect() -> None:
-    """Test parsing AutoAspect response."""
-    message = f"!{constants.DEVICE_AUTOASPECT_QUERY},0"
-    response = AutoAspect(MessageParser(message))
-
-    assert response.name == constants.DEVICE_AUTOASPECT_QUERY
-    assert response.field_auto_aspect == "0"
-
-
-def test_game_mode() -> None:
-    """Test parsing GameMode response."""
-    message = f"!{constants.DEVICE_GAMEMODE_QUERY},1"
-    response = GameMode(MessageParser(message))
-
-    assert response.name == constants.DEVICE_GAMEMODE_QUERY
-    assert response.field_game_mode == "1"
-
-
-def test_output_basic_info() -> None:
-    """Test parsing OutputBasicInfo response."""
-    message = f"!{constants.DEVICE_BASIC_OUTPUT_INFO},5,3,0,3,0"
-    response = OutputBasicInfo(MessageParser(message))
-
-    assert response.name == constants.DEVICE_BASIC_OUTPUT_INFO
-    assert response.output_config == 5
-    assert response.video_out1 == "On"
-    assert response.video_out2 == "On"
-    assert response.video_out3 == "Off"
-    assert response.video_out4 == "Off"
-    assert response.audio_out1 == "On"
-    assert response.audio_out2 == "On"
-    assert response.audio_out3 == "Off"
-    assert response.audio_out4 == "Off"
-
-
-def test_output_mode() -> None:
-    """Test parsing OutputMode response."""
-    message = f"!{constants.DEVICE_OUTPUT_MODE},5994,1920,1080,0,0"
-    response = OutputMode(MessageParser(message))
-
-    assert response.name == constants.DEVICE_OUTPUT_MODE
-    assert response.output_vertical_rate == 59.94
-    assert response.output_vertical_resolution == 1080
-    assert response.output_interlaced == "Progressive"
-    assert response.output_3d_mode == constants.Frame3DTypeEnum.OFF
-
-
-def test_output_color_format() -> None:
-    """Test parsing OutputColorFormat response."""
-    message = f"!{constants.DEVICE_OUTPUT_COLOR_FORMAT},2"
-    response = OutputColorFormat(MessageParser(message))
-
-    assert response.name == constants.DEVICE_OUTPUT_COLOR_FORMAT
-    assert (
-        response.field_output_color_format
-        == constants.OUTPUT_COLOR_FORMAT_RGB_VIDEO_LEVEL
-    )
+_OUTPUTS_OFF = {
+    "video_out1": "Off",
+    "video_out2": "Off",
+    "video_out3": "Off",
+    "video_out4": "Off",
+}
+
+_FULL_INFO_V1_EXPECTED = {
+    "input_status": 1,
+    "source_vertical_rate": 59.94,
+    "source_vertical_resolution": 1080,
+    "source_3d_mode": 2,
+    "active_input_config_number": 5,
+    "source_raster_aspect": 16,
+    "current_source_content_aspect": 9,
+    "nls_active": "NLS",
+    "output_3d_mode": 2,
+    "output_on": _OUTPUTS_OFF,
+    "active_output_cms": 3,
+    "active_output_style": 3,
+    "output_vertical_rate": 60.0,
+    "output_vertical_resolution": 2160,
+    "output_aspect": 16,
+}
+
+_FULL_INFO_V3_EXPECTED = {
+    **_FULL_INFO_V1_EXPECTED,
+    "output_colorspace": 709,
+    "source_dynamic_range": "SDR",
+    "source_mode": "Progressive",
+    "output_mode": "Progressive",
+    "virtual_input_selected": 8,
+    "physical_input_selected": 3,
+}
+
+# (response class, raw message parsed via the `parsed` fixture, expected values)
+RESPONSE_CASES = [
+    pytest.param(
+        FullInfoV1,
+        MSG_FULL_V1,
+        {"name": constants.DEVICE_FULL_V1, **_FULL_INFO_V1_EXPECTED},
+        id="full_info_v1",
+    ),
+    pytest.param(
+        FullInfoV2,
+        MSG_FULL_V2,
+        {
+            "name": constants.DEVICE_FULL_V2,
+            **_FULL_INFO_V3_EXPECTED,
+            "detected_source_raster_aspect": 4,
+            "detected_source_aspect": 9,
+        },
+        id="full_info_v2",
+    ),
+    pytest.param(
+        FullInfoV3,
+        MSG_FULL_V3,
+        {
+            "name": constants.DEVICE_FULL_V3,
+            **_FULL_INFO_V3_EXPECTED,
+            "output_on": {**_OUTPUTS_OFF, "video_out2": "On"},
+        },
+        id="full_info_v3",
+    ),
+    pytest.param(
+        FullInfoV4,
+        MSG_FULL_V4,
+        {
+            "name": constants.DEVICE_FULL_V4,
+            "input_status": 0,
+            "source_vertical_rate": 60.0,
+            "source_vertical_resolution": 1080,
+            "source_3d_mode": 4,
+            "active_input_config_number": 4,
+            "source_raster_aspect": 178,
+            "current_source_content_aspect": 240,
+            "nls_active": "Normal",
+            "output_3d_mode": 4,
+            "output_on": {**_OUTPUTS_OFF, "video_out1": "On"},
+            "active_output_cms": 4,
+            "active_output_style": 4,
+            "output_vertical_rate": 59.94,
+            "output_vertical_resolution": 2160,
+            "output_aspect": 178,
+            "output_colorspace": 2020,
+            "source_dynamic_range": "HDR",
+            "source_mode": "Interlaced",
+            "output_mode": "Progressive",
+            "virtual_input_selected": 1,
+            "physical_input_selected": 2,
+            "detected_source_raster_aspect": 240,
+            "detected_source_aspect": 178,
+        },
+        id="full_info_v4",
+    ),
+    pytest.param(
+        AutoAspect,
+        MSG_AUTO_ASPECT,
+        {"name": constants.DEVICE_AUTOASPECT_QUERY, "field_auto_aspect": "0"},
+        id="auto_aspect",
+    ),
+    pytest.param(
+        GameMode,
+        MSG_GAME_MODE,
+        {"name": constants.DEVICE_GAMEMODE_QUERY, "field_game_mode": "1"},
+        id="game_mode",
+    ),
+    pytest.param(
+        OutputBasicInfo,
+        MSG_OUTPUT_BASIC_INFO,
+        {
+            "name": constants.DEVICE_BASIC_OUTPUT_INFO,
+            "output_config": 5,
+            "video_out1": "On",
+            "video_out2": "On",
+            "video_out3": "Off",
+            "video_out4": "Off",
+            "audio_out1": "On",
+            "audio_out2": "On",
+            "audio_out3": "Off",
+            "audio_out4": "Off",
+        },
+        id="output_basic_info",
+    ),
+    pytest.param(
+        OutputMode,
+        MSG_OUTPUT_MODE,
+        {
+            "name": constants.DEVICE_OUTPUT_MODE,
+            "output_vertical_rate": 59.94,
+            "output_vertical_resolution": 1080,
+            "output_interlaced": "Progressive",
+            "output_3d_mode": constants.Frame3DTypeEnum.OFF,
+        },
+        id="output_mode",
+    ),
+    pytest.param(
+        OutputColorFormat,
+        MSG_OUTPUT_COLOR_FORMAT,
+        {
+            "name": constants.DEVICE_OUTPUT_COLOR_FORMAT,
+            "field_output_color_format": constants.OUTPUT_COLOR_FORMAT_RGB_VIDEO_LEVEL,
+        },
+        id="output_color_format",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("response_cls", "parsed", "expected"), RESPONSE_CASES, indirect=["parsed"]
+)
+def test_response_fields(response_cls, parsed, expected) -> None:
+    """Test parsing responses into their typed fields."""
+    response = response_cls(parsed)
+
+    for field, expected_value in expected.items():
+        assert getattr(response, field) == expected_value, f"Mismatch in {field}"
 
 
 def test_label_query() -> None:
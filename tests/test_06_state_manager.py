@@ -1,16 +1,20 @@
 """Tests for the `lumagen.state_manager` module."""
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+from lumagen.constants import StateStatus
 from lumagen.state_manager import (
+    BaseDeviceId,
     BaseFullInfo,
     BaseInputBasicInfo,
     BaseInputVideo,
+    BaseOperationalState,
     BaseOutputBasicInfo,
     BaseOutputMode,
     DeviceInfo,
     SystemState,
 )
+from lumagen.utils import flatten_dictionary
 import pytest
 
 
@@ -20,6 +24,14 @@ def system_state():
     return SystemState()
 
 
+@pytest.fixture
+def full_info_mock() -> Mock:
+    """Fixture for a fresh BaseFullInfo mock per test."""
+    mock_info = Mock(spec=BaseFullInfo)
+    mock_info.model_dump.return_value = {"new": "data"}
+    return mock_info
+
+
 def test_initial_state(system_state: SystemState) -> None:
     """Test that SystemState initializes correctly."""
     assert system_state.device_id is not None
@@ -55,23 +67,19 @@ def test_reset_state(system_state: SystemState) -> None:
     assert system_state.full_info is not None
 
 
-def test_update_state(system_state: SystemState) -> None:
+def test_update_state(system_state: SystemState, full_info_mock: Mock) -> None:
     """Test updating system state attributes."""
-    mock_info = Mock(spec=BaseFullInfo)
-    assert system_state.update_state(full_info=mock_info) is True
-    assert system_state.full_info == mock_info
+    assert system_state.update_state(full_info=full_info_mock) is True
+    assert system_state.full_info == full_info_mock
 
 
-def test_update_full_info(system_state: SystemState) -> None:
+def test_update_full_info(system_state: SystemState, full_info_mock: Mock) -> None:
     """Test updating full_info state."""
-    mock_info = Mock(spec=BaseFullInfo)
-    mock_info.model_dump.return_value = {"new": "data"}
-
     # Ensure update_full_info can accept and update the state
-    assert system_state.update_full_info(mock_info) is True  # Should update
+    assert system_state.update_full_info(full_info_mock) is True  # Should update
 
     # Calling with the same data should return False (no change)
-    assert system_state.update_full_info(mock_info) is False
+    assert system_state.update_full_info(full_info_mock) is False
 
 
 def test_to_dict(system_state: SystemState) -> None:
@@ -139,6 +147,101 @@ def test_update_device_info_callback(system_state: SystemState) -> None:
     # Modify system state to trigger an update with a real DeviceInfo instance
     modified_device_info = DeviceInfo(model_name="Updated Model")
     system_state._cache.device_info = modified_device_info  # noqa: SLF001
+    system_state._cache.device_info_flat = None  # noqa: SLF001
     system_state._update_device_info()  # noqa: SLF001
 
     mock_callback.assert_called()  # Now the callback must be triggered
+
+
+def test_flat_cache_matches_full_flatten(system_state: SystemState) -> None:
+    """Test that incremental flat-cache patching matches a full rebuild."""
+    system_state.update_state(
+        input_video=BaseInputVideo(input_vertical_rate=6000, input_interlaced="1"),
+        operational_state=BaseOperationalState(auto_aspect="1", is_alive=True),
+    )
+    system_state.update_full_info(
+        BaseFullInfo(source_vertical_rate="059", output_mode="P")
+    )
+    system_state.update_state(
+        input_video=BaseInputVideo(input_interlaced="0"),
+        operational_state=BaseOperationalState(auto_aspect=StateStatus.DISABLED),
+    )
+
+    flat = system_state._cache.flat  # noqa: SLF001
+    assert {k: v for k, v in flat.items() if v is not None} == flatten_dictionary(
+        system_state.to_dict()
+    )
+    assert system_state._cache.device_info == DeviceInfo(**flat)  # noqa: SLF001
+    assert flat["input_vertical_rate"] is None
+    assert flat["auto_aspect"] == "Disabled"
+
+
+def test_update_state_batches_device_info_updates(system_state: SystemState) -> None:
+    """Test that a multi-field update_state fires the callback only once."""
+    mock_callback = Mock()
+    system_state.set_update_callback(mock_callback)
+
+    assert system_state.update_state(
+        input_video=BaseInputVideo(input_vertical_rate=6000),
+        operational_state=BaseOperationalState(game_mode="1"),
+        output_mode=BaseOutputMode(output_interlaced="0"),
+    )
+
+    mock_callback.assert_called_once_with(
+        system_state._cache.device_info  # noqa: SLF001
+    )
+    assert system_state._cache.device_info.game_mode == "Enabled"  # noqa: SLF001
+
+
+def test_update_device_info_skips_unchanged_state(system_state: SystemState) -> None:
+    """Test that an unchanged flattened state does not rebuild DeviceInfo."""
+    mock_callback = Mock()
+    system_state.set_update_callback(mock_callback)
+
+    system_state.update_state(device_id=BaseDeviceId(model_name="Radiance"))
+    device_info = system_state._cache.device_info  # noqa: SLF001
+    mock_callback.assert_called_once_with(device_info)
+
+    with patch("lumagen.state_manager.DeviceInfo") as mock_device_info:
+        system_state._update_device_info()  # noqa: SLF001
+
+    mock_device_info.assert_not_called()
+    mock_callback.assert_called_once()
+    assert system_state._cache.device_info is device_info  # noqa: SLF001
+
+
+def test_update_device_info_changed_state(system_state: SystemState) -> None:
+    """Test that each change to the flattened state rebuilds DeviceInfo."""
+    mock_callback = Mock()
+    system_state.set_update_callback(mock_callback)
+
+    system_state.update_state(device_id=BaseDeviceId(model_name="Radiance"))
+    system_state.update_state(device_id=BaseDeviceId(model_name="RadiancePro"))
+
+    assert system_state._cache.device_info.model_name == "RadiancePro"  # noqa: SLF001
+    assert mock_callback.call_count == 2
+
+
+def test_update_full_info_same_instance_after_reset(system_state: SystemState) -> None:
+    """Test that a repeated full-info instance is only skipped until a reset."""
+    info = BaseFullInfo(source_vertical_rate="24")
+
+    assert system_state.update_full_info(info) is True
+    assert system_state.update_full_info(info) is False
+
+    system_state.reset_state()
+
+    assert system_state.update_full_info(info) is True
+    assert system_state.full_info.source_vertical_rate == 24.0
+
+
+def test_update_full_info_after_update_state(system_state: SystemState) -> None:
+    """Test that re-merging a full-info payload applies after update_state."""
+    info = BaseFullInfo(source_vertical_rate="24")
+    assert system_state.update_full_info(info) is True
+
+    system_state.update_state(full_info=BaseFullInfo(source_vertical_rate="60"))
+    assert system_state.full_info.source_vertical_rate == 60.0
+
+    assert system_state.update_full_info(info) is True
+    assert system_state.full_info.source_vertical_rate == 24.0
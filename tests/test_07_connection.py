@@ -5,7 +5,12 @@ from collections import deque
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from lumagen.classes import TaskManager
-from lumagen.connection import BaseHandler, ConnectionState
+from lumagen.connection import (
+    COMMAND_KEY_LENGTHS,
+    READ_CHUNK_SIZE,
+    BaseHandler,
+    ConnectionState,
+)
 from lumagen.constants import ASCII_COMMAND_LIST, CMD_START, CMD_TERMINATOR
 from lumagen.messages import Response
 import pytest
@@ -17,7 +22,7 @@ import pytest
 def test_connection_state_initialization() -> None:
     """Test that ConnectionState initializes correctly."""
     state = ConnectionState()
-    assert isinstance(state.buffer, deque)
+    assert isinstance(state.buffer, bytearray)
     assert isinstance(state.command_queue, deque)
     assert isinstance(state.command_response_map, dict)
     assert state.last_command_byte == ""
@@ -28,8 +33,9 @@ def test_connection_state_initialization() -> None:
 def test_append_to_buffer() -> None:
     """Test appending data to the buffer."""
     state = ConnectionState()
-    state.append_to_buffer("test_data")
-    assert list(state.buffer) == list("test_data")
+    state.append_to_buffer("test_")
+    state.append_to_buffer(b"data")
+    assert state.buffer == b"test_data"
 
 
 def test_clear_buffer() -> None:
@@ -64,6 +70,7 @@ def test_pop_next_command_with_command() -> None:
 
     # Mock logging to avoid unnecessary log output in tests
     state.log = MagicMock()
+    state.log.isEnabledFor.return_value = True
 
     cmd = state.pop_next_command()
     assert cmd == "CMD1"
@@ -72,6 +79,17 @@ def test_pop_next_command_with_command() -> None:
     state.log.debug.assert_called_with("Commands remaining in queue: %d", 1)
 
 
+def test_pop_next_command_debug_disabled() -> None:
+    """Test that popping a command skips the debug log when DEBUG is off."""
+    state = ConnectionState()
+    state.command_queue.append("CMD1")
+    state.log = MagicMock()
+    state.log.isEnabledFor.return_value = False
+
+    assert state.pop_next_command() == "CMD1"
+    state.log.debug.assert_not_called()
+
+
 def test_pop_next_command_empty_queue() -> None:
     """Test pop_next_command when queue is empty."""
     state = ConnectionState()
@@ -91,25 +109,28 @@ async def test_base_handler_initialization() -> None:
     handler = BaseHandler()
     assert isinstance(handler._task_manager, TaskManager)  # noqa: SLF001
     assert isinstance(handler.connection_state, ConnectionState)
-    assert isinstance(handler._state_lock, asyncio.Lock)  # noqa: SLF001
     assert handler.reader is None
     assert handler.writer is None
 
 
+def _read_once(data: bytes) -> AsyncMock:
+    """Mock `_read_message` returning `data` once, then blocking like an idle stream."""
+    pending = [data]
+
+    async def read_message() -> bytes:
+        if pending:
+            return pending.pop()
+        await asyncio.Event().wait()
+        return b""
+
+    return AsyncMock(side_effect=read_message)
+
+
 @pytest.mark.asyncio
 async def test_process_stream() -> None:
     """Test process_stream starts without error and handles ValueError properly."""
     handler = BaseHandler()
-
-    async def mock_read_single_byte(_):
-        """Mock function to simulate reading a byte once."""
-        if not hasattr(mock_read_single_byte, "called"):
-            mock_read_single_byte.called = True
-            return True
-        return False
-
-    handler._read_single_byte = AsyncMock(side_effect=mock_read_single_byte)  # noqa: SLF001
-    handler._read_additional_data = AsyncMock(return_value="#ZQS00!S00,Ok\n")  # noqa: SLF001
+    handler._read_message = _read_once(b"#ZQS00!S00,Ok\n")  # noqa: SLF001
     handler._dispatcher = MagicMock()  # noqa: SLF001
     handler._dispatcher.invoke_event = AsyncMock()  # noqa: SLF001
     handler._task_manager.get_task = MagicMock(return_value=None)  # noqa: SLF001
@@ -125,8 +146,7 @@ async def test_process_stream() -> None:
         await task
 
     # Second test: Keep valid data, but make Response.factory fail
-    if hasattr(mock_read_single_byte, "called"):
-        del mock_read_single_byte.called
+    handler._read_message = _read_once(b"#ZQS00!S00,Ok\n")  # noqa: SLF001
 
     with patch(
         "lumagen.messages.Response.factory",
@@ -150,14 +170,11 @@ async def test_process_stream() -> None:
             str(error_message) == "Invalid message format"
         ), f"Unexpected log message: {error_message}"
 
-    # Third test: Simulate empty buffer by setting _read_additional_data to return "r\n"
-    if hasattr(mock_read_single_byte, "called"):
-        del mock_read_single_byte.called
-
+    # Third test: Simulate empty buffer by reading only "\r\n"
     handler.process_next_command.reset_mock()
 
-    handler._read_additional_data = AsyncMock(  # noqa: SLF001
-        return_value="\r\n"
+    handler._read_message = _read_once(  # noqa: SLF001
+        b"\r\n"
     )  # Simulates an empty message
 
     task = asyncio.create_task(handler.process_stream())
@@ -170,13 +187,10 @@ async def test_process_stream() -> None:
     handler.process_next_command.assert_not_called()
 
     # Fourth test: Simulate buffer startswith ignored prefixes"
-    if hasattr(mock_read_single_byte, "called"):
-        del mock_read_single_byte.called
-
     handler.process_next_command.reset_mock()
 
-    handler._read_additional_data = AsyncMock(  # noqa: SLF001
-        return_value="#ZY520\r\n"
+    handler._read_message = _read_once(  # noqa: SLF001
+        b"#ZY520\r\n"
     )  # Simulates an ignored prefix
 
     task = asyncio.create_task(handler.process_stream())
@@ -187,13 +201,10 @@ async def test_process_stream() -> None:
         await task
 
     # Fifth test: Simulate buffer keypress"
-    if hasattr(mock_read_single_byte, "called"):
-        del mock_read_single_byte.called
-
     handler.process_next_command.reset_mock()
 
-    handler._read_additional_data = AsyncMock(  # noqa: SLF001
-        return_value="#X{"
+    handler._read_message = _read_once(  # noqa: SLF001
+        b"#X{"
     )  # Simulates a keypress
 
     with patch(
@@ -207,21 +218,20 @@ async def test_process_stream() -> None:
     with pytest.raises(asyncio.CancelledError):
         await task
 
-    mock_process_command.assert_called_once_with("#X{", ASCII_COMMAND_LIST)
+    mock_process_command.assert_called_once_with(
+        "#X{", ASCII_COMMAND_LIST, COMMAND_KEY_LENGTHS
+    )
 
     expected_log_message = "Received Keypress Command: Exit"
-    handler.log.debug.assert_called_with(expected_log_message)
+    handler.log.debug.assert_any_call(expected_log_message)
 
     handler.process_next_command.assert_called()
 
     # Sixth test: Simulate buffer ends with terminator"
-    if hasattr(mock_read_single_byte, "called"):
-        del mock_read_single_byte.called
-
     handler.process_next_command.reset_mock()
 
-    handler._read_additional_data = AsyncMock(  # noqa: SLF001
-        return_value="Z\n"
+    handler._read_message = _read_once(  # noqa: SLF001
+        b"Z\n"
     )
 
     task = asyncio.create_task(handler.process_stream())
@@ -236,16 +246,16 @@ async def test_process_stream() -> None:
     # Seventh test: simulate process stream cancel task"
     handler.process_next_command.reset_mock()
 
-    async def mock_read_single_byte_wait(_):
+    async def mock_read_message_wait():
         while True:
             await asyncio.sleep(1)  # Simulates a never-ending read
 
-    handler._read_single_byte = AsyncMock(side_effect=mock_read_single_byte_wait)  # noqa: SLF001
+    handler._read_message = AsyncMock(side_effect=mock_read_message_wait)  # noqa: SLF001
 
     task = asyncio.create_task(handler.process_stream())
     await asyncio.sleep(0.1)  # Give time for the task to enter the infinite wait state
 
-    task.cancel()  # Force cancel since `_read_single_byte` never returns
+    task.cancel()  # Force cancel since `_read_message` never returns
 
     with pytest.raises(asyncio.CancelledError):
         await task  # Ensure the task actually raises CancelledError
@@ -254,47 +264,30 @@ async def test_process_stream() -> None:
 
 
 @pytest.mark.asyncio
-async def test_read_single_byte() -> None:
-    """Test reading a single byte from the stream."""
+async def test_read_message_unterminated() -> None:
+    """Test that unterminated data is returned once the stream goes idle."""
     handler = BaseHandler()
-    handler.reader = AsyncMock()
-    handler.reader.read = AsyncMock(return_value=b"A")
-
-    buffer_manager = MagicMock()
-    buffer_manager.append = MagicMock()
+    handler.reader = asyncio.StreamReader()
+    handler.reader.feed_data(b"#X{")
 
-    result = await handler._read_single_byte(buffer_manager)  # noqa: SLF001
-    assert result is True
-    buffer_manager.append.assert_called_with("A")
+    with patch("lumagen.connection.READ_IDLE_TIMEOUT", 0.01):
+        result = await handler._read_message()  # noqa: SLF001
+    assert result == b"#X{"
 
 
 @pytest.mark.asyncio
-async def test_read_single_byte_stream_ended() -> None:
-    """Test reading a single byte when the stream ends unexpectedly."""
+async def test_read_message_stream_ended() -> None:
+    """Test reading a message when the stream ends unexpectedly."""
     handler = BaseHandler()
-    handler.reader = AsyncMock()
-    handler.reader.read = AsyncMock(return_value=b"")
+    handler.reader = asyncio.StreamReader()
+    handler.reader.feed_eof()
     handler.log = MagicMock()
 
-    buffer_manager = MagicMock()
-
-    result = await handler._read_single_byte(buffer_manager)  # noqa: SLF001
-    assert result is False
+    result = await handler._read_message()  # noqa: SLF001
+    assert result == b""
     handler.log.warning.assert_called_with("Stream ended unexpectedly")
 
 
-@pytest.mark.asyncio
-async def test_read_additional_data() -> None:
-    """Test reading additional data from the stream."""
-    handler = BaseHandler()
-    handler.reader = AsyncMock()
-    handler.reader.readuntil = AsyncMock(return_value=b"DATA\n")
-    handler.reader.read = AsyncMock(return_value=b"DATA")
-
-    result = await handler._read_additional_data()  # noqa: SLF001
-    assert result == "DATA\n"
-
-
 @pytest.mark.asyncio
 async def test_queue_command_valid() -> None:
     """Test queuing a valid command."""
@@ -320,149 +313,90 @@ async def test_queue_command_invalid() -> None:
     handler.log.error.assert_called_with("No valid commands to queue.")
 
 
-def test_should_exit_processing_sending_command_true() -> None:
-    """Test that _should_exit_processing returns True when sending_command is True."""
-    connection = BaseHandler()  # Create a real instance of the class
-    connection.connection_state = MagicMock()
-    connection.connection_state.sending_command = True
-    connection.connection_state.has_pending_commands.return_value = True
-
-    assert connection._should_exit_processing() is True  # noqa: SLF001
-
-
-def test_should_exit_processing_no_pending_commands() -> None:
-    """Test that _should_exit_processing returns True when there are no pending commands."""
-    connection = BaseHandler()
-    connection.connection_state = MagicMock()
-    connection.connection_state.sending_command = False
-    connection.connection_state.has_pending_commands.return_value = False
-
-    assert connection._should_exit_processing() is True  # noqa: SLF001
-
-
-def test_should_exit_processing_continue_processing() -> None:
-    """Test that _should_exit_processing returns False when there are pending commands."""
-    connection = BaseHandler()
-    connection.connection_state = MagicMock()
-    connection.connection_state.sending_command = False
-    connection.connection_state.has_pending_commands.return_value = True
-
-    assert connection._should_exit_processing() is False  # noqa: SLF001
-
-
 @pytest.mark.asyncio
-async def test_process_next_command_exits_on_should_exit() -> None:
-    """Test that _process_next_command exits immediately if _should_exit_processing returns True."""
+async def test_send_commands_sends_one_command_per_wake() -> None:
+    """Test that the consumer sends a single queued command each time it is woken."""
     connection = BaseHandler()
-    connection._should_exit_processing = MagicMock(return_value=True)  # noqa: SLF001
-    connection.connection_state = MagicMock()
-    connection.connection_state.pop_next_command.return_value = None
     connection.send = AsyncMock()
+    connection.connection_state.command_queue.extend(["CMD1", "CMD2"])
 
-    await connection._process_next_command()  # noqa: SLF001
-
-    connection._should_exit_processing.assert_called_once()  # noqa: SLF001
-    connection.send.assert_not_called()  # No command should be sent
+    connection._task_manager.add_task(  # noqa: SLF001
+        connection._send_commands(),  # noqa: SLF001
+        "send_commands",
+    )
 
+    connection.process_next_command()
+    await asyncio.sleep(0.01)
+    connection.send.assert_called_once_with(CMD_START + b"CMD1" + CMD_TERMINATOR)
 
-@pytest.mark.asyncio
-async def test_process_next_command_sends_command() -> None:
-    """Test that _process_next_command sends a command when available."""
-    connection = BaseHandler()
-    connection._should_exit_processing = MagicMock(  # noqa: SLF001
-        side_effect=[False, True]
-    )  # Process one command, then exit
-    connection.connection_state = MagicMock()
-    connection.connection_state.pop_next_command.return_value = "TEST_CMD"
-    connection.send = AsyncMock(return_value=True)
+    connection.process_next_command()
+    await asyncio.sleep(0.01)
+    connection.send.assert_called_with(CMD_START + b"CMD2" + CMD_TERMINATOR)
 
-    await connection._process_next_command()  # noqa: SLF001
+    connection.process_next_command()
+    await asyncio.sleep(0.01)
+    assert connection.send.call_count == 2  # Queue drained, nothing more to send
 
-    connection.send.assert_called_once_with(CMD_START + b"TEST_CMD" + CMD_TERMINATOR)
+    await connection.close()
 
 
 @pytest.mark.asyncio
-async def test_process_next_command_stops_when_send_fails() -> None:
-    """Test that _process_next_command stops processing when send fails."""
+async def test_send_commands_survives_send_error() -> None:
+    """Test that a failing send is logged and the next command still goes out."""
     connection = BaseHandler()
-    connection._should_exit_processing = MagicMock(  # noqa: SLF001
-        side_effect=[False, True]
-    )  # Process one command, then exit
-    connection.connection_state = MagicMock()
-    connection.connection_state.pop_next_command.return_value = "FAIL_CMD"
-    connection.send = AsyncMock(return_value=False)  # Simulate send failure
-
-    await connection._process_next_command()  # noqa: SLF001
-
-    connection.send.assert_called_once_with(CMD_START + b"FAIL_CMD" + CMD_TERMINATOR)
-    connection._should_exit_processing.assert_called_once()  # noqa: SLF001
-
+    connection.log = MagicMock()
+    connection.send = AsyncMock(side_effect=[OSError("port closed"), None])
+    connection.connection_state.command_queue.extend(["CMD1", "CMD2"])
+    connection._task_manager.add_task(  # noqa: SLF001
+        connection._send_commands(),  # noqa: SLF001
+        "send_commands",
+    )
 
-@pytest.mark.asyncio
-async def test_process_next_command_respects_max_iterations() -> None:
-    """Test that _process_next_command stops after max_iterations."""
-    connection = BaseHandler()
-    connection._should_exit_processing = MagicMock(return_value=False)  # noqa: SLF001
-    connection.connection_state = MagicMock()
-    connection.connection_state.pop_next_command.return_value = "ITER_CMD"
-    connection.send = AsyncMock(return_value=True)
+    connection.process_next_command()
+    await asyncio.sleep(0.01)
+    connection.log.error.assert_called_once()
+    assert connection.connection_state.sending_command is False
 
-    await connection._process_next_command(max_iterations=2)  # noqa: SLF001
+    connection.process_next_command()
+    await asyncio.sleep(0.01)
+    connection.send.assert_called_with(CMD_START + b"CMD2" + CMD_TERMINATOR)
+    assert connection._task_manager.get_task("send_commands")  # noqa: SLF001
 
-    assert connection.send.call_count == 2  # Ensure it only runs twice
+    await connection.close()
 
 
 @pytest.mark.asyncio
-async def test_process_next_command_skips_empty_command() -> None:
-    """Test that _process_next_command skips processing when pop_next_command returns None or an empty string."""
+async def test_send_commands_waits_while_sending() -> None:
+    """Test that the consumer sends nothing while sending_command is set."""
     connection = BaseHandler()
-    connection._should_exit_processing = MagicMock(  # noqa: SLF001
-        side_effect=[False, False, False, True]
-    )  # Ensure looping
-    connection.connection_state = MagicMock()
-
-    # First two calls return falsy values (None and empty string), third call returns a valid command
-    connection.connection_state.pop_next_command.side_effect = [None, "", "VALID_CMD"]
+    connection.send = AsyncMock()
+    connection.connection_state.command_queue.append("CMD1")
+    connection.connection_state.sending_command = True
 
-    connection.send = AsyncMock(return_value=True)
+    connection._task_manager.add_task(  # noqa: SLF001
+        connection._send_commands(),  # noqa: SLF001
+        "send_commands",
+    )
 
-    await connection._process_next_command(max_iterations=4)  # noqa: SLF001
+    connection.process_next_command()
+    await asyncio.sleep(0.01)
+    connection.send.assert_not_called()
+    assert list(connection.connection_state.command_queue) == ["CMD1"]
 
-    # Ensure send was called only once (for "VALID_CMD"), skipping None and ""
-    connection.send.assert_called_once_with(CMD_START + b"VALID_CMD" + CMD_TERMINATOR)
+    await connection.close()
 
 
-def test_process_next_command_task_exists() -> None:
-    """Test that process_next_command does not add a task if it already exists."""
+def test_process_next_command_wakes_consumer() -> None:
+    """Test that process_next_command only wakes the consumer, never spawning tasks."""
     connection = BaseHandler()
     connection._task_manager = MagicMock()  # noqa: SLF001
 
-    # Simulate that the task already exists
-    connection._task_manager.get_task.return_value = True  # noqa: SLF001
-
     connection.process_next_command()
 
-    # Ensure add_task is never called
+    assert connection._command_ready.is_set()  # noqa: SLF001
     connection._task_manager.add_task.assert_not_called()  # noqa: SLF001
 
 
-@pytest.mark.asyncio
-async def test_process_next_command_task_not_exists() -> None:
-    """Test that process_next_command properly schedules _process_next_command using the real task manager."""
-
-    connection = BaseHandler()  # Use the real BaseHandler with its real task manager
-    connection._process_next_command = AsyncMock()  # noqa: SLF001
-
-    # Call process_next_command() and let the real task manager handle it
-    connection.process_next_command()
-
-    # Wait for the task manager to execute the task
-    await asyncio.sleep(0.1)  # ? Allows time for the event loop to process tasks
-
-    # Ensure `_process_next_command()` was actually called
-    connection._process_next_command.assert_awaited_once()  # noqa: SLF001
-
-
 @pytest.mark.asyncio
 async def test_queue_command_invalid_type() -> None:
     """Test that queue_command logs an error and returns when given an invalid type."""
@@ -494,49 +428,117 @@ async def test_send_not_implemented() -> None:
 
 
 @pytest.mark.asyncio
-async def test_read_additional_data_readuntil_success() -> None:
-    """Test that _read_additional_data returns decoded data when readuntil() succeeds."""
+async def test_read_message_readuntil_success() -> None:
+    """Test that _read_message returns a terminated message from one readuntil()."""
     connection = BaseHandler()
     connection.reader = AsyncMock()
 
     # Simulate readuntil returning bytes with a newline
     connection.reader.readuntil.return_value = b"TEST DATA\n"
 
-    result = await connection._read_additional_data()  # noqa: SLF001
+    result = await connection._read_message()  # noqa: SLF001
 
-    assert result.strip() == "TEST DATA"
+    assert result == b"TEST DATA\n"
+    connection.reader.readuntil.assert_awaited_once_with(separator=b"\n")
+    connection.reader.read.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_read_additional_data_fallback_to_read() -> None:
-    """Test that _read_additional_data uses read(1024) when readuntil() times out."""
+async def test_read_message_fallback_to_read() -> None:
+    """Test that _read_message reads a chunk when readuntil() times out."""
     connection = BaseHandler()
     connection.reader = AsyncMock()
 
     # Simulate readuntil timing out
     connection.reader.readuntil.side_effect = asyncio.exceptions.TimeoutError()
 
-    # Simulate read(1024) succeeding
-    connection.reader.read.return_value = b"FALLBACK DATA"
+    # Simulate the chunked read returning a whole keypress echo
+    connection.reader.read.return_value = b"#X{"
 
-    result = await connection._read_additional_data()  # noqa: SLF001
+    result = await connection._read_message()  # noqa: SLF001
 
-    assert result == "FALLBACK DATA"
+    assert result == b"#X{"
+    connection.reader.read.assert_awaited_once_with(READ_CHUNK_SIZE)
 
 
 @pytest.mark.asyncio
-async def test_read_additional_data_both_fail() -> None:
-    """Test that _read_additional_data returns an empty string when both reads fail."""
+async def test_read_message_fragment_waits_for_terminator() -> None:
+    """Test that a fragment read after a timeout is joined with the rest."""
     connection = BaseHandler()
     connection.reader = AsyncMock()
+    connection.reader.readuntil.side_effect = [
+        asyncio.exceptions.TimeoutError(),
+        b" DATA\n",
+    ]
+    connection.reader.read.return_value = b"FALLBACK"
+
+    result = await connection._read_message()  # noqa: SLF001
+
+    assert result == b"FALLBACK DATA\n"
+    assert connection.reader.readuntil.await_count == 2
 
-    # Simulate both read methods timing out
-    connection.reader.readuntil.side_effect = asyncio.exceptions.TimeoutError()
-    connection.reader.read.side_effect = asyncio.exceptions.TimeoutError()
 
-    result = await connection._read_additional_data()  # noqa: SLF001
+@pytest.mark.asyncio
+async def test_read_message_keeps_bytes_past_newline() -> None:
+    """Test that bytes after the last newline are returned by the next read."""
+    connection = BaseHandler()
+    connection.reader = AsyncMock()
+    connection.reader.readuntil.side_effect = [
+        asyncio.exceptions.TimeoutError(),
+        b"4,1,059,1080,0\n",
+    ]
+    connection.reader.read.return_value = b"!S02,1\n!I2"
+
+    assert await connection._read_message() == b"!S02,1\n"  # noqa: SLF001
+    assert await connection._read_message() == b"!I24,1,059,1080,0\n"  # noqa: SLF001
+
+
+async def _feed_in_chunks(
+    reader: asyncio.StreamReader, data: bytes, size: int = 3
+) -> None:
+    """Feed `data` to `reader` in small pieces, pausing longer than the idle timeout."""
+    await asyncio.sleep(0.05)
+    for start in range(0, len(data), size):
+        reader.feed_data(data[start : start + size])
+        await asyncio.sleep(0.02)
+
+
+@pytest.mark.asyncio
+async def test_read_message_chunked_status_message() -> None:
+    """Test that a status message fed in chunks after idling is read whole."""
+    handler = BaseHandler()
+    handler.reader = asyncio.StreamReader()
+    message = b"!I24,1,059,1080,0\n"
+
+    with patch("lumagen.connection.READ_IDLE_TIMEOUT", 0.01):
+        feeder = asyncio.create_task(_feed_in_chunks(handler.reader, message))
+        result = await handler._read_message()  # noqa: SLF001
+        await feeder
+
+    assert result == message
+
+
+@pytest.mark.asyncio
+async def test_process_stream_dispatches_chunked_message() -> None:
+    """Test that process_stream dispatches a message that arrives in chunks."""
+    handler = BaseHandler()
+    handler.reader = asyncio.StreamReader()
+    handler._dispatcher = MagicMock()  # noqa: SLF001
+    handler._dispatcher.invoke_event = AsyncMock()  # noqa: SLF001
+    handler.process_next_command = MagicMock()
+
+    with patch("lumagen.connection.READ_IDLE_TIMEOUT", 0.01):
+        task = asyncio.create_task(handler.process_stream())
+        await _feed_in_chunks(handler.reader, b"!S02,1\n")
+        await asyncio.sleep(0.05)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
 
-    assert result == ""
+    handler._dispatcher.invoke_event.assert_awaited_once()  # noqa: SLF001
+    call = handler._dispatcher.invoke_event.call_args  # noqa: SLF001
+    assert call.kwargs["message"] == "S02"
 
 
 @pytest.mark.asyncio
@@ -544,9 +546,7 @@ async def test_process_stream_reads_data() -> None:
     """Test that process_stream reads and appends data to the buffer."""
     connection = BaseHandler()
 
-    # Ensure _read_single_byte correctly handles buffer_manager argument
-    connection._read_single_byte = AsyncMock(return_value=True)  # noqa: SLF001
-    connection._read_additional_data = AsyncMock(return_value="TEST DATA")  # noqa: SLF001
+    connection._read_message = AsyncMock(return_value=b"TEST DATA")  # noqa: SLF001
     connection._dispatcher = MagicMock()  # noqa: SLF001
     connection.process_next_command = MagicMock()
 
@@ -554,9 +554,8 @@ async def test_process_stream_reads_data() -> None:
     with pytest.raises(asyncio.TimeoutError):
         await asyncio.wait_for(connection.process_stream(), timeout=0.1)
 
-    # Ensure read functions were called
-    connection._read_single_byte.assert_called()  # noqa: SLF001
-    connection._read_additional_data.assert_called()  # noqa: SLF001
+    # Ensure the read function was called
+    connection._read_message.assert_called()  # noqa: SLF001
 
 
 @pytest.mark.asyncio
@@ -57,6 +57,7 @@ async def test_connection_made(serial_handler, mock_transport) -> None:  # noqa:
     assert serial_handler.transport == mock_transport
     mock_transport.serial.reset_input_buffer.assert_called_once()
     mock_transport.serial.reset_output_buffer.assert_called_once()
+    assert serial_handler._task_manager.get_task("send_commands")  # noqa: SLF001
 
     serial_handler._dispatcher.invoke_event.assert_called_with(  # noqa: SLF001
         EventType.CONNECTION_STATE,
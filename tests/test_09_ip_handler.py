@@ -49,6 +49,7 @@ async def test_open_connection(mocker, ip_handler, mock_streams) -> None:
     assert ip_handler.writer is mock_streams[1]
 
     mock_open_connection.assert_called_once_with("127.0.0.1", 8080)
+    assert ip_handler._task_manager.get_task("send_commands")  # noqa: SLF001
     ip_handler._dispatcher.invoke_event.assert_called_with(  # noqa: SLF001
         EventType.CONNECTION_STATE,
         state=ConnectionStatus.CONNECTED,
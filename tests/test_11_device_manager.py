@@ -1575,7 +1575,7 @@ async def test_device_info_callback_logs_debug(
     with patch("lumagen.device_manager.custom_log_pprint") as mock_pprint:
         dm._device_info_callback(new_device_info)  # noqa: SLF001
 
-        mock_pprint.assert_called_once_with(new_device_info.model_dump(), dm.log.debug)
+        mock_pprint.assert_called_once_with(new_device_info.model_dump(), dm.log)
 
 
 @pytest.mark.asyncio
@@ -1901,7 +1901,7 @@ async def test_handle_system_state_update_status_id(
         assert dm.context.system_state.state_models[state_attr] == response
 
         expected_dict = response.model_dump()
-        mock_pprint.assert_called_once_with(expected_dict, dm.log.debug)
+        mock_pprint.assert_called_once_with(expected_dict, dm.log)
 
 
 @pytest.mark.asyncio
@@ -1952,7 +1952,7 @@ async def test_handle_full_info_update(
         dm.context.system_state.update_full_info.assert_called_once_with(response)
         dm.log.info.assert_called_once_with("Full Info %s Updated", version)
         mock_pprint.assert_called_once_with(
-            dm.context.system_state.full_info.model_dump(), dm.log.debug
+            dm.context.system_state.full_info.model_dump(), dm.log
         )
 
 
@@ -2212,7 +2212,9 @@ async def test_show_all(device_manager: tuple[DeviceManager, str]) -> None:
         dm.context.system_state.to_dict.assert_called_once()
 
         # Ensure `custom_log_pprint` is called with the expected arguments
-        mock_pprint.assert_called_once_with({"mocked": "data"}, dm.log.info)
+        mock_pprint.assert_called_once_with(
+            {"mocked": "data"}, dm.log, logging.INFO
+        )
 
 
 @pytest.mark.asyncio
@@ -2244,7 +2246,7 @@ async def test_show_info_with_device_info(
 
         # Ensure `custom_log_pprint` is called with the correct data
         mock_pprint.assert_called_once_with(
-            {"model": "MockDevice", "version": "1.0"}, dm.log.info
+            {"model": "MockDevice", "version": "1.0"}, dm.log, logging.INFO
         )
 
 
@@ -2353,7 +2355,8 @@ async def test_show_labels_with_labels(
                 key: dm.labels[key]
                 for key in sorted(dm.labels.keys(), key=lambda k: (k[0].isdigit(), k))
             },
-            dm.log.info,
+            dm.log,
+            logging.INFO,
         )
 
         # Ensure lists are categorized correctly
@@ -2419,7 +2422,7 @@ async def test_show_source_list_with_data(
         dm.log.debug.assert_called_once_with("Displaying source list:")
 
         # Ensure correct display
-        mock_pprint.assert_called_once_with(dm.source_list, dm.log.debug)
+        mock_pprint.assert_called_once_with(dm.source_list, dm.log)
 
 
 @pytest.mark.asyncio